@@ -3,12 +3,18 @@
 This is intentionally strict: any finding causes a non-zero exit.
 We scan git-tracked files only (detect-secrets default behavior) to avoid
 failing on untracked/generated artifacts.
+
+Pass ``--changed-since REF`` to scan only tracked files that differ from REF
+(e.g. ``origin/main``). Outside a git worktree, or if REF cannot be resolved,
+the full scan runs instead.
 """
 
 from __future__ import annotations
 
+import argparse
 import contextlib
 import json
+import shutil
 import subprocess
 import sys
 import tempfile
@@ -28,7 +34,46 @@ def _load_json(payload: str) -> dict[str, Any]:
     return data
 
 
-def main() -> int:
+def _changed_files(ref: str) -> list[str] | None:
+    """Return tracked files changed since ref (committed or not), or None if git can't tell."""
+    try:
+        proc = subprocess.run(
+            ["git", "diff", "--name-only", "--diff-filter=d", "-z", ref, "--"],
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return [name for name in proc.stdout.decode("utf-8").split("\0") if name]
+
+
+def _scan_paths(changed_since: str | None) -> list[str] | None:
+    """Paths to pass to detect-secrets ([] for a full scan), or None when nothing changed."""
+    if not changed_since:
+        return []
+
+    changed = _changed_files(changed_since)
+    if changed is None:
+        print(f"detect-secrets: could not diff against {changed_since}; scanning all files.", file=sys.stderr)
+        return []
+
+    return changed or None
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="only scan files changed since this git ref (falls back to a full scan)",
+    )
+    args = parser.parse_args(argv)
+
+    scan_paths = _scan_paths(args.changed_since)
+    if scan_paths is None:
+        return 0
+
     baseline_path = Path(".secrets.baseline")
     if not baseline_path.exists():
         print("detect-secrets baseline file is missing: .secrets.baseline", file=sys.stderr)
@@ -37,13 +82,12 @@ def main() -> int:
     # detect-secrets may update the baseline (e.g., generated_at) even when
     # running in a read-only "check" mode. Run against a temporary copy to
     # keep the git working tree clean.
-    baseline_payload = baseline_path.read_text(encoding="utf-8")
-    with tempfile.NamedTemporaryFile(mode="w", encoding="utf-8", suffix=".baseline", delete=False) as tf:
-        tf.write(baseline_payload)
+    with tempfile.NamedTemporaryFile(suffix=".baseline", delete=False) as tf:
         tmp_baseline = tf.name
+    shutil.copyfile(baseline_path, tmp_baseline)
 
     proc = subprocess.run(
-        ["detect-secrets", "scan", "--baseline", tmp_baseline],
+        ["detect-secrets", "scan", *scan_paths, "--baseline", tmp_baseline],
         capture_output=True,
         text=True,
     )
@@ -14,6 +14,7 @@ from .cross_reference import (
     add_source_attribution,
     create_dev_to_backlinks,
     enhance_post_with_cross_references,
+    enhance_posts_with_cross_references,
     generate_related_links,
 )
 from .manager import AIOptimizationManager, create_default_ai_optimization_manager
@@ -30,6 +31,7 @@ __all__ = [
     "generate_related_links",
     "create_dev_to_backlinks",
     "enhance_post_with_cross_references",
+    "enhance_posts_with_cross_references",
     "AIOptimizationManager",
     "create_default_ai_optimization_manager",
     "DevToMetadataEnhancer",
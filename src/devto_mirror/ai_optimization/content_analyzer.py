@@ -15,6 +15,18 @@ logger = logging.getLogger(__name__)
 
 _LANG_PATTERN_CLASS = "class "
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_PRE_BLOCK_RE = re.compile(r"<pre[^>]*>(.*?)</pre>", re.DOTALL | re.IGNORECASE)
+_CODE_TAG_RE = re.compile(r"<code[^>]*>(.*?)</code>", re.DOTALL | re.IGNORECASE)
+_IMG_TAG_RE = re.compile(r"<img[^>]*>", re.IGNORECASE)
+_LINK_TAG_RE = re.compile(r"<a[^>]*href[^>]*>", re.IGNORECASE)
+_FENCED_LANG_RE = re.compile(r"```([a-zA-Z0-9+#-]+)")
+_LANG_ATTRIBUTE_RES = (
+    re.compile(r'class=["\'][^"\']*(?:language|lang)-([a-zA-Z0-9+#-]+)', re.IGNORECASE),
+    re.compile(r'data-lang=["\']([a-zA-Z0-9+#-]+)["\']', re.IGNORECASE),
+    re.compile(r'data-language=["\']([a-zA-Z0-9+#-]+)["\']', re.IGNORECASE),
+)
+
 
 class DevToContentAnalyzer:
     """
@@ -226,7 +238,7 @@ class DevToContentAnalyzer:
 
         try:
             # Remove HTML tags to get plain text
-            text_content = re.sub(r"<[^>]+>", "", content)
+            text_content = _HTML_TAG_RE.sub("", content)
 
             # Remove extra whitespace
             text_content = " ".join(text_content.split())
@@ -251,16 +263,14 @@ class DevToContentAnalyzer:
             metrics["text_length_chars"] = len(text_content)
 
             # Count code blocks (basic estimation)
-            code_blocks = re.findall(r"<pre[^>]*>.*?</pre>", content, re.DOTALL | re.IGNORECASE)
-            code_blocks += re.findall(r"<code[^>]*>.*?</code>", content, re.DOTALL | re.IGNORECASE)
-            metrics["code_blocks_count"] = len(code_blocks)
+            metrics["code_blocks_count"] = len(_PRE_BLOCK_RE.findall(content)) + len(_CODE_TAG_RE.findall(content))
 
             # Count images
-            images = re.findall(r"<img[^>]*>", content, re.IGNORECASE)
+            images = _IMG_TAG_RE.findall(content)
             metrics["images_count"] = len(images)
 
             # Count links
-            links = re.findall(r"<a[^>]*href[^>]*>", content, re.IGNORECASE)
+            links = _LINK_TAG_RE.findall(content)
             metrics["links_count"] = len(links)
 
         except Exception as e:
@@ -317,14 +327,8 @@ class DevToContentAnalyzer:
     def _extract_languages_from_attributes(self, content: str) -> set:
         """Extract programming languages from HTML class and data attributes."""
         languages = set()
-        lang_class_patterns = [
-            r'class=["\'][^"\']*(?:language|lang)-([a-zA-Z0-9+#-]+)',
-            r'data-lang=["\']([a-zA-Z0-9+#-]+)["\']',
-            r'data-language=["\']([a-zA-Z0-9+#-]+)["\']',
-        ]
-
-        for pattern in lang_class_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
+        for pattern in _LANG_ATTRIBUTE_RES:
+            matches = pattern.findall(content)
             for match in matches:
                 lang = match.lower().strip()
                 if lang and len(lang) <= 20:
@@ -335,7 +339,7 @@ class DevToContentAnalyzer:
     def _extract_languages_from_fenced_blocks(self, content: str) -> set:
         """Extract programming languages from fenced code blocks (```language)."""
         languages = set()
-        fenced_blocks = re.findall(r"```([a-zA-Z0-9+#-]+)", content)
+        fenced_blocks = _FENCED_LANG_RE.findall(content)
         for lang in fenced_blocks:
             lang = lang.lower().strip()
             if lang and len(lang) <= 20:
@@ -358,15 +362,15 @@ class DevToContentAnalyzer:
         code_blocks = []
 
         # Extract content from <pre> and <code> tags
-        pre_blocks = re.findall(r"<pre[^>]*>(.*?)</pre>", content, re.DOTALL | re.IGNORECASE)
+        pre_blocks = _PRE_BLOCK_RE.findall(content)
         code_blocks.extend(pre_blocks)
 
-        code_tags = re.findall(r"<code[^>]*>(.*?)</code>", content, re.DOTALL | re.IGNORECASE)
+        code_tags = _CODE_TAG_RE.findall(content)
         code_blocks.extend(code_tags)
 
         # Clean HTML tags from extracted content
         combined_code = " ".join(code_blocks)
-        clean_code = re.sub(r"<[^>]+>", "", combined_code)
+        clean_code = _HTML_TAG_RE.sub("", combined_code)
 
         return clean_code
 
@@ -28,34 +28,62 @@ def _clean_tag_list(tags: Any) -> list[str]:
     return cleaned
 
 
+def _tag_bloom(tags_lower: list[str]) -> int:
+    """Return a 64-bit Bloom mask over lowercase tags (two hash probes per tag).
+
+    A zero AND between two masks proves the tag sets are disjoint, so callers can
+    skip the set intersection for the common no-overlap case.
+    """
+    bloom = 0
+    for tag in tags_lower:
+        h = hash(tag)
+        bloom |= (1 << (h & 63)) | (1 << ((h >> 6) & 63))
+    return bloom
+
+
+# (post, slug, tags, lowercase tags, Bloom mask over the lowercase tags)
+_TagProfile = tuple[Any, str, set[str], set[str], int]
+
+
+def _tag_profiles(posts: List[Any]) -> list[_TagProfile]:
+    """Precompute tag data for every tagged post so each post is cleaned only once."""
+    profiles: list[_TagProfile] = []
+    for post in posts:
+        tags = _clean_tag_list(getattr(post, "tags", []))
+        if not tags:
+            continue
+        tags_lower = [t.lower() for t in tags]
+        profiles.append((post, getattr(post, "slug", ""), set(tags), set(tags_lower), _tag_bloom(tags_lower)))
+    return profiles
+
+
 def _score_related_post(
     *,
     current_slug: str,
-    current_tags: list[str],
-    current_tags_lower: list[str],
-    other_post: Any,
+    current_tags: set[str],
+    current_tags_lower: set[str],
+    current_bloom: int,
+    other: _TagProfile,
 ) -> dict | None:
-    other_slug = getattr(other_post, "slug", "")
+    other_post, other_slug, other_tags, other_tags_lower, other_bloom = other
     if other_slug == current_slug:
         return None
 
-    other_tags = _clean_tag_list(getattr(other_post, "tags", []))
-    if not other_tags:
+    if not current_bloom & other_bloom:
         return None
 
-    other_tags_lower = [t.lower() for t in other_tags]
-    shared = set(current_tags_lower) & set(other_tags_lower)
+    shared = current_tags_lower.intersection(other_tags_lower)
     if not shared:
         return None
 
-    exact = set(current_tags) & set(other_tags)
+    exact = current_tags.intersection(other_tags)
     score = len(shared) + (len(exact) * 0.5)
 
     return {
         "post": other_post,
         "score": score,
-        "shared_tags": list(shared),
-        "exact_matches": list(exact),
+        "shared_tags": sorted(shared),
+        "exact_matches": sorted(exact),
     }
 
 
@@ -154,6 +182,14 @@ def generate_related_links(post: Any, all_posts: List[Any], max_related: int = 5
     Returns:
         List of related post dictionaries with title, link, and relevance info
     """
+    try:
+        return _related_links_from_profiles(post, _tag_profiles(all_posts), max_related)
+    except Exception:
+        logger.exception("Error generating related links")
+        return []
+
+
+def _related_links_from_profiles(post: Any, profiles: list[_TagProfile], max_related: int = 5) -> List[Dict[str, str]]:
     related_posts: list[dict[str, str]] = []
 
     try:
@@ -165,15 +201,19 @@ def generate_related_links(post: Any, all_posts: List[Any], max_related: int = 5
 
         current_slug = getattr(post, "slug", "")
         current_tags_lower = [tag.lower() for tag in current_tags]
+        current_bloom = _tag_bloom(current_tags_lower)
+        current_tags_set = set(current_tags)
+        current_tags_lower_set = set(current_tags_lower)
 
         # Score other posts based on tag overlap
         post_scores: list[dict] = []
-        for other_post in all_posts:
+        for other in profiles:
             scored = _score_related_post(
                 current_slug=current_slug,
-                current_tags=current_tags,
-                current_tags_lower=current_tags_lower,
-                other_post=other_post,
+                current_tags=current_tags_set,
+                current_tags_lower=current_tags_lower_set,
+                current_bloom=current_bloom,
+                other=other,
             )
             if scored:
                 post_scores.append(scored)
@@ -386,10 +426,41 @@ def enhance_post_with_cross_references(
     Returns:
         Dictionary containing all cross-reference enhancements
     """
+    return enhance_posts_with_cross_references([post], all_posts, site_config)[0]
+
+
+def enhance_posts_with_cross_references(
+    posts: List[Any], all_posts: List[Any], site_config: Optional[Dict[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Batch form of enhance_post_with_cross_references.
+
+    Tag data for all_posts is prepared once and shared by every post, instead of
+    being rebuilt for each one.
+
+    Args:
+        posts: Post objects to enhance
+        all_posts: List of all posts for related content generation
+        site_config: Optional site configuration
+
+    Returns:
+        Cross-reference dictionaries, in the same order as posts
+    """
+    try:
+        profiles = _tag_profiles(all_posts)
+    except Exception:
+        logger.exception("Error indexing posts for related links")
+        profiles = []
+    return [_cross_reference_data(post, profiles, site_config) for post in posts]
+
+
+def _cross_reference_data(
+    post: Any, profiles: list[_TagProfile], site_config: Optional[Dict[str, str]]
+) -> Dict[str, Any]:
     try:
         cross_ref_data = {
             "attribution": add_source_attribution(post, site_config),
-            "related_posts": generate_related_links(post, all_posts),
+            "related_posts": _related_links_from_profiles(post, profiles),
             "backlinks": create_dev_to_backlinks(post),
         }
 
@@ -7,10 +7,49 @@ while ensuring graceful fallback when optimization fails.
 """
 
 import logging
+import os
 from typing import Any, Dict, List, Optional
 
+from devto_mirror.core.process_pool import map_in_processes
+
+from .content_analyzer import DevToContentAnalyzer
+from .metadata_enhancer import DevToMetadataEnhancer
+from .optimized_post import AIOptimizedPost
+from .schema_generator import DevToSchemaGenerator
+from .sitemap_generator import DevToAISitemapGenerator
+
 logger = logging.getLogger(__name__)
 
+# Bit flags for AIOptimizationManager.component_mask
+HAS_SCHEMA = 1 << 0
+HAS_METADATA = 1 << 1
+HAS_CONTENT = 1 << 2
+HAS_CROSS_REFERENCE = 1 << 3
+HAS_SITEMAP = 1 << 4
+
+_COMPONENT_FLAGS = (
+    ("schema", HAS_SCHEMA),
+    ("metadata", HAS_METADATA),
+    ("content", HAS_CONTENT),
+    ("cross_reference", HAS_CROSS_REFERENCE),
+    ("sitemap", HAS_SITEMAP),
+)
+
+# Per-process state for optimize_posts workers, populated by _init_optimize_worker
+_worker_manager: Optional["AIOptimizationManager"] = None
+_worker_all_posts: Optional[List[Any]] = None
+
+
+def _init_optimize_worker(manager: "AIOptimizationManager", all_posts: Optional[List[Any]]) -> None:
+    """Install the manager and post list once per worker process."""
+    global _worker_manager, _worker_all_posts
+    _worker_manager = manager
+    _worker_all_posts = all_posts
+
+
+def _optimize_in_worker(post: Any) -> Dict[str, Any]:
+    return _worker_manager.optimize_post(post, all_posts=_worker_all_posts)
+
 
 class AIOptimizationManager:
     """
@@ -47,16 +86,32 @@ class AIOptimizationManager:
 
         # Track optimization status for error handling
         self.optimization_enabled = True
-        self.component_status = {
-            "schema": schema_generator is not None,
-            "metadata": metadata_enhancer is not None,
-            "content": content_analyzer is not None,
-            "cross_reference": cross_reference_manager is not None,
-            "sitemap": sitemap_generator is not None,
-        }
+        self.component_mask = (
+            (HAS_SCHEMA if schema_generator is not None else 0)
+            | (HAS_METADATA if metadata_enhancer is not None else 0)
+            | (HAS_CONTENT if content_analyzer is not None else 0)
+            | (HAS_CROSS_REFERENCE if cross_reference_manager is not None else 0)
+            | (HAS_SITEMAP if sitemap_generator is not None else 0)
+        )
+
+    @property
+    def component_status(self) -> Dict[str, bool]:
+        """Per-component availability, expanded from component_mask."""
+        return {name: bool(self.component_mask & flag) for name, flag in _COMPONENT_FLAGS}
+
+    def _generate_schemas(self, post: Any, canonical_url: str, api_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Generate the article and breadcrumb schemas for a post."""
+        article_schema = self.schema_generator.generate_article_schema(post, canonical_url, api_data)
+        breadcrumb_schema = self.schema_generator.generate_breadcrumb_schema(post)
+        return [article_schema, breadcrumb_schema]
 
     def _apply_optional_components(
-        self, post: Any, api_data: Dict[str, Any], all_posts: List[Any], optimization_data: Dict[str, Any]
+        self,
+        post: Any,
+        slug: str,
+        api_data: Dict[str, Any],
+        all_posts: List[Any],
+        optimization_data: Dict[str, Any],
     ) -> None:
         """
         Apply optional AI optimization components (metadata, content, cross-reference).
@@ -66,33 +121,36 @@ class AIOptimizationManager:
 
         Args:
             post: Post object to optimize
+            slug: Post slug, used in failure warnings
             api_data: Dev.to API data for the post
             all_posts: List of all posts for cross-referencing
             optimization_data: Dictionary to update with results
         """
-        slug = getattr(post, "slug", "unknown")
-
-        if self.metadata_enhancer:
+        steps = (
+            (HAS_METADATA, "enhanced_metadata", self._enhance_metadata, "Metadata enhancement"),
+            (HAS_CONTENT, "content_analysis", self._analyze_content, "Content analysis"),
+            (HAS_CROSS_REFERENCE, "cross_references", self._build_cross_references, "Cross-reference generation"),
+        )
+        for flag, result_key, step, label in steps:
+            if not self.component_mask & flag:
+                continue
             try:
-                optimization_data["enhanced_metadata"] = self.metadata_enhancer.enhance_post_metadata(post)
+                optimization_data[result_key] = step(post, api_data, all_posts)
             except Exception as e:
-                logger.warning(f"Metadata enhancement failed for post {slug}: {e}")
+                logger.warning("%s failed for post %s: %s", label, slug, e)
 
-        if self.content_analyzer:
-            try:
-                optimization_data["content_analysis"] = self.content_analyzer.analyze_post_content(post, api_data)
-            except Exception as e:
-                logger.warning(f"Content analysis failed for post {slug}: {e}")
+    def _enhance_metadata(self, post: Any, api_data: Dict[str, Any], all_posts: List[Any]) -> Dict[str, str]:
+        return self.metadata_enhancer.enhance_post_metadata(post)
 
-        if self.cross_reference_manager:
-            try:
-                optimization_data["cross_references"] = {
-                    "source_attribution": self.cross_reference_manager.add_source_attribution(post),
-                    "related_links": self.cross_reference_manager.generate_related_links(post, all_posts),
-                    "backlinks": self.cross_reference_manager.create_dev_to_backlinks(post),
-                }
-            except Exception as e:
-                logger.warning(f"Cross-reference generation failed for post {slug}: {e}")
+    def _analyze_content(self, post: Any, api_data: Dict[str, Any], all_posts: List[Any]) -> Dict[str, Any]:
+        return self.content_analyzer.analyze_post_content(post, api_data)
+
+    def _build_cross_references(self, post: Any, api_data: Dict[str, Any], all_posts: List[Any]) -> Dict[str, Any]:
+        return {
+            "source_attribution": self.cross_reference_manager.add_source_attribution(post),
+            "related_links": self.cross_reference_manager.generate_related_links(post, all_posts),
+            "backlinks": self.cross_reference_manager.create_dev_to_backlinks(post),
+        }
 
     def optimize_post(self, post: Any, api_data: Dict[str, Any] = None, all_posts: List[Any] = None) -> Dict[str, Any]:
         """
@@ -114,7 +172,9 @@ class AIOptimizationManager:
             "optimization_applied": False,
         }
 
-        if not self.optimization_enabled:
+        # Every component hangs off schema generation, so without a schema generator
+        # there is nothing to do.
+        if not self.optimization_enabled or not self.component_mask & HAS_SCHEMA:
             return optimization_data
 
         # Use provided api_data or fall back to post.api_data
@@ -125,19 +185,52 @@ class AIOptimizationManager:
         # become aware of fatal schema generation errors instead of silently
         # continuing. Other components may still be guarded to allow graceful
         # degradation.
-        if self.schema_generator:
-            canonical_url = getattr(post, "link", "")
-            article_schema = self.schema_generator.generate_article_schema(post, canonical_url, api_data)
-            breadcrumb_schema = self.schema_generator.generate_breadcrumb_schema(post)
-
-            optimization_data["json_ld_schemas"] = [article_schema, breadcrumb_schema]
+        slug = getattr(post, "slug", "unknown")
+        link = getattr(post, "link", "")
+        optimization_data["json_ld_schemas"] = self._generate_schemas(post, link, api_data)
 
-            self._apply_optional_components(post, api_data, all_posts, optimization_data)
+        self._apply_optional_components(post, slug, api_data, all_posts, optimization_data)
 
-            optimization_data["optimization_applied"] = True
+        optimization_data["optimization_applied"] = True
 
         return optimization_data
 
+    def optimize_posts(
+        self, posts: List[Any], all_posts: List[Any] = None, max_workers: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Apply all AI optimizations to many posts, spreading the work across processes.
+
+        The manager and all_posts reach each forked worker once (via the pool
+        initializer); only the individual posts and their results cross the
+        process boundary per task. Small batches, DEVTO_MIRROR_PARALLEL=false, and
+        batches the pool cannot take (a post cannot be pickled, the pool fails to
+        start, or a worker dies) run serially instead; see map_in_processes. Any
+        exception raised while optimizing a post propagates unchanged.
+
+        Args:
+            posts: Post objects to optimize
+            all_posts: Optional list of all posts for cross-referencing
+            max_workers: Worker process count (defaults to os.cpu_count())
+
+        Returns:
+            List of optimization data dictionaries, in the same order as posts
+        """
+        posts = list(posts)
+        workers = min(max_workers or os.cpu_count() or 1, len(posts)) or 1
+        results = map_in_processes(
+            _optimize_in_worker,
+            [(post,) for post in posts],
+            max_workers=workers,
+            initializer=_init_optimize_worker,
+            initargs=(self, all_posts),
+            chunksize=max(1, len(posts) // (4 * workers)),
+            label="post optimization",
+        )
+        if results is None:
+            results = [self.optimize_post(post, all_posts=all_posts) for post in posts]
+        return results
+
     def generate_optimized_sitemap(self, posts: List[Any], comments: List[Dict[str, Any]]) -> Optional[str]:
         """
         Generate AI-optimized sitemap using the sitemap generator.
@@ -167,8 +260,6 @@ class AIOptimizationManager:
         Returns:
             AIOptimizedPost instance with content analysis capabilities
         """
-        from devto_mirror.ai_optimization import AIOptimizedPost
-
         return AIOptimizedPost.from_post(post, self.content_analyzer)
 
     def create_optimized_posts(self, posts: List[Any]) -> List[Any]:
@@ -187,9 +278,7 @@ class AIOptimizationManager:
                 optimized_post = self.create_optimized_post(post)
                 optimized_posts.append(optimized_post)
             except Exception as e:
-                logger.warning(f"Failed to create optimized post for {getattr(post, 'slug', 'unknown')}: {e}")
-                from devto_mirror.ai_optimization import AIOptimizedPost
-
+                logger.warning("Failed to create optimized post for %s: %s", getattr(post, "slug", "unknown"), e)
                 optimized_posts.append(AIOptimizedPost(post, None))
 
         return optimized_posts
@@ -203,8 +292,8 @@ class AIOptimizationManager:
         """
         return {
             "enabled": self.optimization_enabled,
-            "components": self.component_status.copy(),
-            "active_components": sum(self.component_status.values()),
+            "components": self.component_status,
+            "active_components": self.component_mask.bit_count(),
         }
 
 
@@ -221,13 +310,6 @@ def create_default_ai_optimization_manager(
     Returns:
         Configured AIOptimizationManager instance
     """
-    from devto_mirror.ai_optimization import (
-        DevToAISitemapGenerator,
-        DevToContentAnalyzer,
-        DevToMetadataEnhancer,
-        DevToSchemaGenerator,
-    )
-
     schema_generator = DevToSchemaGenerator(site_name, site_url)
     metadata_enhancer = DevToMetadataEnhancer(site_name, site_url)
     content_analyzer = DevToContentAnalyzer()
@@ -16,6 +16,8 @@ logger = logging.getLogger(__name__)
 
 DEVTO_DOMAIN = "dev.to"
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 
 class DevToMetadataEnhancer:
     """
@@ -262,7 +264,7 @@ class DevToMetadataEnhancer:
         content = getattr(post, "content_html", "") or getattr(post, "content", "")
         if content:
             # Remove HTML tags for cleaner hash
-            clean_content = re.sub(r"<[^>]+>", "", content)
+            clean_content = _HTML_TAG_RE.sub("", content)
             content_sample = clean_content[:100].strip()
             if content_sample:
                 fingerprint_data.append(f"content:{content_sample}")
@@ -9,6 +9,8 @@ import hashlib
 import logging
 from typing import Any, Dict, List, Optional
 
+from .content_analyzer import DevToContentAnalyzer
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -31,10 +33,7 @@ class AIOptimizedPost:
         """
         self._original_post = post
 
-        # Import here to avoid circular imports
         if content_analyzer is None:
-            from .content_analyzer import DevToContentAnalyzer
-
             content_analyzer = DevToContentAnalyzer()
 
         self._content_analyzer = content_analyzer
@@ -4,13 +4,27 @@ import logging
 import re
 from typing import Any, Dict, Optional, Tuple
 
-from .utils import validate_json_ld_schema
+from .utils import SCHEMA_ORG_CONTEXT, validate_json_ld_schema
 
 logger = logging.getLogger(__name__)
 
-SCHEMA_ORG_BASE = "https://schema.org"
+SCHEMA_ORG_BASE = SCHEMA_ORG_CONTEXT
 JSON_LD_CONTEXT = "@context"
 JSON_LD_TYPE = "@type"
+
+# Schema.org type names shared by every emitted schema
+SCHEMA_TYPE_ARTICLE = "Article"
+SCHEMA_TYPE_PERSON = "Person"
+SCHEMA_TYPE_ORGANIZATION = "Organization"
+SCHEMA_TYPE_WEB_PAGE = "WebPage"
+SCHEMA_TYPE_WEB_SITE = "WebSite"
+SCHEMA_TYPE_BREADCRUMB_LIST = "BreadcrumbList"
+SCHEMA_TYPE_LIST_ITEM = "ListItem"
+SCHEMA_TYPE_IMAGE_OBJECT = "ImageObject"
+SCHEMA_TYPE_SEARCH_ACTION = "SearchAction"
+SCHEMA_TYPE_ENTRY_POINT = "EntryPoint"
+SCHEMA_TYPE_INTERACTION_COUNTER = "InteractionCounter"
+SCHEMA_TYPE_PROPERTY_VALUE = "PropertyValue"
 SCHEMA_ORG_COMMENT_ACTION = "https://schema.org/CommentAction"
 SCHEMA_ORG_LIKE_ACTION = "https://schema.org/LikeAction"
 
@@ -19,6 +33,8 @@ INTERACTION_TYPE_MAPPING = {
     "interactionCount": SCHEMA_ORG_LIKE_ACTION,
 }
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
 
 class DevToSchemaGenerator:
     """Generate Schema.org compliant JSON-LD structured data for Dev.to mirror sites."""
@@ -26,6 +42,12 @@ class DevToSchemaGenerator:
     def __init__(self, site_name: str = "ChecKMarK Dev.to Mirror", site_url: str = ""):
         self.site_name = site_name
         self.site_url = site_url.rstrip("/")
+        # Home and Posts are the same two breadcrumb entries for every post
+        self._posts_url = f"{self.site_url}/posts" if self.site_url else "/posts"
+        self._breadcrumb_trail = (
+            {JSON_LD_TYPE: SCHEMA_TYPE_LIST_ITEM, "position": 1, "name": "Home", "item": self.site_url or "/"},
+            {JSON_LD_TYPE: SCHEMA_TYPE_LIST_ITEM, "position": 2, "name": "Posts", "item": self._posts_url},
+        )
 
     def _extract_author_info(self, canonical_url: str, api_data: Optional[Dict[str, Any]]) -> Tuple[str, str]:
         """
@@ -88,7 +110,7 @@ class DevToSchemaGenerator:
             image_url = getattr(post, "cover_image", "")
 
         if image_url:
-            return {JSON_LD_TYPE: "ImageObject", "url": image_url, "width": 1000, "height": 500}
+            return {JSON_LD_TYPE: SCHEMA_TYPE_IMAGE_OBJECT, "url": image_url, "width": 1000, "height": 500}
         return None
 
     def _extract_tags(self, post: Any, api_data: Optional[Dict[str, Any]]) -> list:
@@ -113,7 +135,7 @@ class DevToSchemaGenerator:
         """
         if not content_html:
             return 0
-        text_content = re.sub(r"<[^>]+>", "", content_html)
+        text_content = _HTML_TAG_RE.sub("", content_html)
         return len(text_content.split())
 
     def _extract_content_metrics(self, post: Any, api_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
@@ -150,7 +172,7 @@ class DevToSchemaGenerator:
 
         """
         return {
-            JSON_LD_TYPE: "InteractionCounter",
+            JSON_LD_TYPE: SCHEMA_TYPE_INTERACTION_COUNTER,
             "interactionType": interaction_type,
             "userInteractionCount": count,
         }
@@ -223,7 +245,7 @@ class DevToSchemaGenerator:
 
         if "pageViews" in interaction_stats:
             result["additionalProperty"] = [
-                {JSON_LD_TYPE: "PropertyValue", "name": "pageViews", "value": interaction_stats["pageViews"]}
+                {JSON_LD_TYPE: SCHEMA_TYPE_PROPERTY_VALUE, "name": "pageViews", "value": interaction_stats["pageViews"]}
             ]
 
         return result
@@ -236,11 +258,15 @@ class DevToSchemaGenerator:
 
         schema = {
             JSON_LD_CONTEXT: SCHEMA_ORG_BASE,
-            JSON_LD_TYPE: "Article",
+            JSON_LD_TYPE: SCHEMA_TYPE_ARTICLE,
             "headline": getattr(post, "title", "Untitled"),
-            "author": {JSON_LD_TYPE: "Person", "name": author_name, "url": author_url},
-            "publisher": {JSON_LD_TYPE: "Organization", "name": self.site_name, "url": self.site_url or canonical_url},
-            "mainEntityOfPage": {JSON_LD_TYPE: "WebPage", "@id": canonical_url},
+            "author": {JSON_LD_TYPE: SCHEMA_TYPE_PERSON, "name": author_name, "url": author_url},
+            "publisher": {
+                JSON_LD_TYPE: SCHEMA_TYPE_ORGANIZATION,
+                "name": self.site_name,
+                "url": self.site_url or canonical_url,
+            },
+            "mainEntityOfPage": {JSON_LD_TYPE: SCHEMA_TYPE_WEB_PAGE, "@id": canonical_url},
             "url": canonical_url,
         }
 
@@ -275,7 +301,7 @@ class DevToSchemaGenerator:
     def generate_website_schema(self, site_info: Dict[str, Any]) -> Dict[str, Any]:
         schema = {
             JSON_LD_CONTEXT: SCHEMA_ORG_BASE,
-            JSON_LD_TYPE: "WebSite",
+            JSON_LD_TYPE: SCHEMA_TYPE_WEB_SITE,
             "@id": site_info.get("url", self.site_url),
             "name": site_info.get("name", self.site_name),
             "url": site_info.get("url", self.site_url),
@@ -287,8 +313,11 @@ class DevToSchemaGenerator:
 
         if self.site_url:
             schema["potentialAction"] = {
-                JSON_LD_TYPE: "SearchAction",
-                "target": {JSON_LD_TYPE: "EntryPoint", "urlTemplate": f"{self.site_url}/?q={{search_term_string}}"},
+                JSON_LD_TYPE: SCHEMA_TYPE_SEARCH_ACTION,
+                "target": {
+                    JSON_LD_TYPE: SCHEMA_TYPE_ENTRY_POINT,
+                    "urlTemplate": f"{self.site_url}/?q={{search_term_string}}",
+                },
                 "query-input": "required name=search_term_string",
             }
 
@@ -299,28 +328,24 @@ class DevToSchemaGenerator:
         return {}
 
     def generate_breadcrumb_schema(self, post: Any) -> Dict[str, Any]:
-        breadcrumbs = [
-            {JSON_LD_TYPE: "ListItem", "position": 1, "name": "Home", "item": self.site_url or "/"},
-            {
-                JSON_LD_TYPE: "ListItem",
-                "position": 2,
-                "name": "Posts",
-                "item": f"{self.site_url}/posts" if self.site_url else "/posts",
-            },
-        ]
+        breadcrumbs = [dict(item) for item in self._breadcrumb_trail]
 
         post_title = getattr(post, "title", "Post")
         post_slug = getattr(post, "slug", "post")
         breadcrumbs.append(
             {
-                JSON_LD_TYPE: "ListItem",
+                JSON_LD_TYPE: SCHEMA_TYPE_LIST_ITEM,
                 "position": 3,
                 "name": post_title,
-                "item": f"{self.site_url}/posts/{post_slug}.html" if self.site_url else f"/posts/{post_slug}.html",
+                "item": f"{self._posts_url}/{post_slug}.html",
             }
         )
 
-        schema = {JSON_LD_CONTEXT: SCHEMA_ORG_BASE, JSON_LD_TYPE: "BreadcrumbList", "itemListElement": breadcrumbs}
+        schema = {
+            JSON_LD_CONTEXT: SCHEMA_ORG_BASE,
+            JSON_LD_TYPE: SCHEMA_TYPE_BREADCRUMB_LIST,
+            "itemListElement": breadcrumbs,
+        }
 
         if validate_json_ld_schema(schema):
             return schema
@@ -60,8 +60,9 @@ class DevToAISitemapGenerator:
             )
 
             # Add post entries with AI-enhanced metadata
+            now = datetime.now()
             for post in posts:
-                entry = self._create_post_url_entry(post)
+                entry = self._create_post_url_entry(post, now=now)
                 if entry:
                     sitemap_entries.append(entry)
 
@@ -95,6 +96,7 @@ class DevToAISitemapGenerator:
             categorized_posts = self._categorize_posts_by_type(posts)
 
             sitemap_entries = []
+            now = datetime.now()
 
             # Add entries for each content category
             for content_type, type_posts in categorized_posts.items():
@@ -116,7 +118,7 @@ class DevToAISitemapGenerator:
 
                 # Add individual posts in this category
                 for post in type_posts:
-                    entry = self._create_post_url_entry(post, content_type=content_type)
+                    entry = self._create_post_url_entry(post, content_type=content_type, now=now)
                     if entry:
                         sitemap_entries.append(entry)
 
@@ -183,13 +185,16 @@ class DevToAISitemapGenerator:
 
         return entry
 
-    def _create_post_url_entry(self, post: Any, content_type: str = None) -> Dict[str, Any]:
+    def _create_post_url_entry(
+        self, post: Any, content_type: str = None, now: Optional[datetime] = None
+    ) -> Dict[str, Any]:
         """
         Create a sitemap URL entry for a blog post with AI-enhanced metadata.
 
         Args:
             post: Post object
             content_type: Optional content type classification
+            now: Reference time for post age (shared across a sitemap build)
 
         Returns:
             Dictionary containing post URL entry data
@@ -210,7 +215,7 @@ class DevToAISitemapGenerator:
             lastmod = post_date.isoformat() if post_date else None
 
             # Determine change frequency based on post age and type
-            changefreq = self._determine_post_changefreq(post)
+            changefreq = self._determine_post_changefreq(post, now)
 
             # Determine priority based on content type and engagement
             priority = self._determine_post_priority(post, content_type)
@@ -331,12 +336,13 @@ class DevToAISitemapGenerator:
 
         return classify_content_type(tags)
 
-    def _determine_post_changefreq(self, post: Any) -> str:
+    def _determine_post_changefreq(self, post: Any, now: Optional[datetime] = None) -> str:
         """
         Determine change frequency for a post based on age.
 
         Args:
             post: Post object
+            now: Reference time for post age (defaults to the current time)
 
         Returns:
             Change frequency string
@@ -346,7 +352,7 @@ class DevToAISitemapGenerator:
             return "monthly"
 
         # Calculate post age
-        age_days = (datetime.now() - post_date.replace(tzinfo=None)).days
+        age_days = ((now or datetime.now()) - post_date.replace(tzinfo=None)).days
 
         # Newer posts change more frequently
         if age_days < 7:
@@ -11,6 +11,8 @@ from typing import Any, Dict, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+SCHEMA_ORG_CONTEXT = "https://schema.org"
+
 CONTENT_TYPE_MAPPINGS: List[Tuple[str, List[str]]] = [
     ("tutorial", ["tutorial", "howto", "guide", "walkthrough", "stepbystep", "beginners"]),
     ("discussion", ["discuss", "discussion", "watercooler", "community", "opinion", "thoughts"]),
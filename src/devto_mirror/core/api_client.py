@@ -12,9 +12,15 @@ from datetime import datetime, timezone
 from typing import List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 logger = logging.getLogger(__name__)
 
+# Every request goes to dev.to, so one host pool is enough; size it to cover the
+# concurrent full-article fetches so no keep-alive connection is ever discarded.
+DEVTO_POOL_CONNECTIONS = 1
+DEVTO_POOL_MAXSIZE = 8
+
 
 def create_devto_session() -> requests.Session:
     """
@@ -47,6 +53,11 @@ def create_devto_session() -> requests.Session:
         headers["api-key"] = api_key
 
     session.headers.update(headers)
+
+    # Retries stay in fetch_page_with_retry / _fetch_full_article_json, which
+    # back off on timeouts only; the adapter just manages connection reuse.
+    adapter = HTTPAdapter(pool_connections=DEVTO_POOL_CONNECTIONS, pool_maxsize=DEVTO_POOL_MAXSIZE)
+    session.mount("https://", adapter)
     return session
 
 
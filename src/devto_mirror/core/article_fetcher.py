@@ -6,9 +6,9 @@ into `src/` so `scripts/generate_site.py` can stay a thin entrypoint.
 
 from __future__ import annotations
 
-import json
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -16,6 +16,13 @@ from typing import Any
 import requests
 
 from devto_mirror.core.api_client import create_devto_session, fetch_page_with_retry, filter_new_articles
+from devto_mirror.core.json_utils import load_json_file
+
+# Full-article requests start FULL_ARTICLE_REQUEST_INTERVAL seconds apart (the
+# same pacing the API has always seen from us), but a slow response no longer
+# delays the next request: up to FULL_ARTICLE_MAX_WORKERS can be in flight.
+FULL_ARTICLE_REQUEST_INTERVAL = 0.8
+FULL_ARTICLE_MAX_WORKERS = 4
 
 
 @dataclass(frozen=True, slots=True)
@@ -71,7 +78,7 @@ def _try_load_cached_articles(*, posts_data_path: str | os.PathLike, username: s
         if not p.exists():
             return []
 
-        cached_data = json.loads(p.read_text(encoding="utf-8"))
+        cached_data = load_json_file(p)
         if not cached_data:
             return []
 
@@ -85,34 +92,40 @@ def _try_load_cached_articles(*, posts_data_path: str | os.PathLike, username: s
         return []
 
 
-def _fetch_article_pages(*, username: str, last_run_iso: str | None) -> list[dict]:
+def _fetch_article_pages(
+    *, username: str, last_run_iso: str | None, session: requests.Session | None = None
+) -> list[dict]:
+    owns_session = session is None
+    if session is None:
+        session = create_devto_session()
+
     articles: list[dict] = []
     page = 1
     api_base = "https://dev.to/api/articles"
 
-    session = create_devto_session()
-
     per_page = 100
-    while True:
-        params = {"username": username, "page": page, "per_page": per_page}
-        if page == 1:
-            params["_cb"] = time.time() // 60
-
-        data = fetch_page_with_retry(session, api_base, params, page)
-        if not data:
-            break
-
-        new_or_updated_articles = filter_new_articles(data, last_run_iso)
-        articles.extend(new_or_updated_articles)
-
-        # DEV.to orders this list by publish time, not edit time. Page until exhaustion.
-        if len(data) < per_page:
-            break
-
-        page += 1
-        time.sleep(0.5)
-
-    session.close()
+    try:
+        while True:
+            params = {"username": username, "page": page, "per_page": per_page}
+            if page == 1:
+                params["_cb"] = time.time() // 60
+
+            data = fetch_page_with_retry(session, api_base, params, page)
+            if not data:
+                break
+
+            new_or_updated_articles = filter_new_articles(data, last_run_iso)
+            articles.extend(new_or_updated_articles)
+
+            # DEV.to orders this list by publish time, not edit time. Page until exhaustion.
+            if len(data) < per_page:
+                break
+
+            page += 1
+            time.sleep(0.5)
+    finally:
+        if owns_session:
+            session.close()
     return articles
 
 
@@ -145,24 +158,34 @@ def _fetch_full_article_json(
     return None
 
 
-def _fetch_full_articles(*, article_summaries: list[dict]) -> tuple[list[dict], list[dict]]:
-    session = create_devto_session()
+def _fetch_full_articles(
+    *, article_summaries: list[dict], session: requests.Session | None = None
+) -> tuple[list[dict], list[dict]]:
+    owns_session = session is None
+    if session is None:
+        session = create_devto_session()
 
     full_articles: list[dict] = []
     failed_articles: list[dict] = []
 
-    for i, article in enumerate(article_summaries):
-        article_id = int(article.get("id") or 0)
-        full = _fetch_full_article_json(session, article_id=article_id)
-        if full is None:
-            failed_articles.append(article)
-        else:
-            full_articles.append(full)
-
-        if i < len(article_summaries) - 1:
-            time.sleep(0.8)
-
-    session.close()
+    try:
+        with ThreadPoolExecutor(max_workers=FULL_ARTICLE_MAX_WORKERS) as executor:
+            futures = []
+            for i, article in enumerate(article_summaries):
+                if i:
+                    time.sleep(FULL_ARTICLE_REQUEST_INTERVAL)
+                article_id = int(article.get("id") or 0)
+                futures.append(executor.submit(_fetch_full_article_json, session, article_id=article_id))
+
+            for article, future in zip(article_summaries, futures):
+                full = future.result()
+                if full is None:
+                    failed_articles.append(article)
+                else:
+                    full_articles.append(full)
+    finally:
+        if owns_session:
+            session.close()
     return full_articles, failed_articles
 
 
@@ -210,16 +233,19 @@ def fetch_all_articles_from_api(
             source="mock",
         )
 
-    summaries = _fetch_article_pages(username=username, last_run_iso=last_run_iso)
-    if not summaries:
-        if last_run_iso:
-            return FetchArticlesResult(articles=[], success=True, no_new_posts=True, source="api")
-        return FetchArticlesResult(articles=[], success=True, no_new_posts=False, source="api")
+    # One pooled session for the listing pages and the full-article fetches, so
+    # connections opened while paging are reused for the articles.
+    with create_devto_session() as session:
+        summaries = _fetch_article_pages(username=username, last_run_iso=last_run_iso, session=session)
+        if not summaries:
+            if last_run_iso:
+                return FetchArticlesResult(articles=[], success=True, no_new_posts=True, source="api")
+            return FetchArticlesResult(articles=[], success=True, no_new_posts=False, source="api")
 
-    try:
-        full_articles, _failed = _fetch_full_articles(article_summaries=summaries)
-    except Exception:
-        full_articles = []
+        try:
+            full_articles, _failed = _fetch_full_articles(article_summaries=summaries, session=session)
+        except Exception:
+            full_articles = []
 
     if not full_articles:
         cached = _try_load_cached_articles(posts_data_path=posts_data_path, username=username)
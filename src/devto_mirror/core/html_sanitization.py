@@ -6,10 +6,84 @@ triggering script side-effects.
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import inspect
 import re
+import sys
+import threading
 
 import bleach
 
+_SCRIPT_STYLE_BLOCK_RE = re.compile(r"(?is)<(script|style)\b[^>]*>.*?</\1>")
+
+
+_ALLOWED_TAGS = [
+    "p",
+    "br",
+    "strong",
+    "em",
+    "a",
+    "div",
+    "span",
+    "code",
+    "pre",
+    "blockquote",
+    "ul",
+    "ol",
+    "li",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "img",
+    "hr",
+]
+
+_ALLOWED_ATTRIBUTES = {
+    # Keep links readable and allow embed/card markup to style anchors.
+    "a": ["href", "title", "rel", "target", "class"],
+    # Dev.to "ltag" embeds use wrapper div/span with class hooks.
+    "div": ["class"],
+    "span": ["class"],
+    # allow width/height/loading so we can avoid CLS and improve Lighthouse scores
+    "img": ["src", "alt", "width", "height", "style", "class", "title", "loading"],
+}
+
+# bleach.clean builds a new Cleaner (html5lib parser, serializer, filters) on every
+# call. Cleaners are reused instead, one per thread because a Cleaner is not
+# thread-safe.
+_thread_cleaners = threading.local()
+
+
+def _post_cleaner() -> bleach.Cleaner:
+    cleaner = getattr(_thread_cleaners, "post", None)
+    if cleaner is None:
+        # IMPORTANT: strip disallowed tags rather than escaping them into visible text.
+        cleaner = _thread_cleaners.post = bleach.Cleaner(
+            tags=_ALLOWED_TAGS,
+            attributes=_ALLOWED_ATTRIBUTES,
+            strip=True,
+            strip_comments=True,
+        )
+    return cleaner
+
+
+def _strip_cleaner() -> bleach.Cleaner:
+    cleaner = getattr(_thread_cleaners, "strip", None)
+    if cleaner is None:
+        cleaner = _thread_cleaners.strip = bleach.Cleaner(tags=[], strip=True)
+    return cleaner
+
+
+def strip_html_tags(text: str) -> str:
+    """Remove every HTML tag from text, keeping the text inside them."""
+    if not text:
+        return ""
+    return _strip_cleaner().clean(text)
+
 
 def sanitize_html_content(content: str) -> str:
     """Sanitize post HTML while preserving basic formatting and safe embed wrappers.
@@ -27,47 +101,21 @@ def sanitize_html_content(content: str) -> str:
 
     # Remove script/style blocks entirely (tag + content) so their payload doesn't
     # end up as visible text after sanitization.
-    content = re.sub(r"(?is)<(script|style)\b[^>]*>.*?</\1>", "", content)
-
-    allowed_tags = [
-        "p",
-        "br",
-        "strong",
-        "em",
-        "a",
-        "div",
-        "span",
-        "code",
-        "pre",
-        "blockquote",
-        "ul",
-        "ol",
-        "li",
-        "h1",
-        "h2",
-        "h3",
-        "h4",
-        "h5",
-        "h6",
-        "img",
-        "hr",
-    ]
-
-    allowed_attributes = {
-        # Keep links readable and allow embed/card markup to style anchors.
-        "a": ["href", "title", "rel", "target", "class"],
-        # Dev.to "ltag" embeds use wrapper div/span with class hooks.
-        "div": ["class"],
-        "span": ["class"],
-        # allow width/height/loading so we can avoid CLS and improve Lighthouse scores
-        "img": ["src", "alt", "width", "height", "style", "class", "title", "loading"],
-    }
-
-    # IMPORTANT: strip disallowed tags rather than escaping them into visible text.
-    return bleach.clean(
-        content,
-        tags=allowed_tags,
-        attributes=allowed_attributes,
-        strip=True,
-        strip_comments=True,
-    )
+    content = _SCRIPT_STYLE_BLOCK_RE.sub("", content)
+
+    return _post_cleaner().clean(content)
+
+
+@functools.lru_cache(maxsize=1)
+def _source_hash() -> str:
+    return hashlib.sha256(inspect.getsource(sys.modules[__name__]).encode("utf-8")).hexdigest()
+
+
+def sanitizer_fingerprint() -> str:
+    """Identify what sanitize_html_content produces: bleach version, allow-lists and this module's code.
+
+    Caches of sanitized output (the post page genhash) include it, so a sanitizer
+    change invalidates them.
+    """
+    config = repr((bleach.__version__, _ALLOWED_TAGS, sorted(_ALLOWED_ATTRIBUTES.items()), _source_hash()))
+    return hashlib.sha256(config.encode("utf-8")).hexdigest()
@@ -0,0 +1,97 @@
+"""Process-pool helper for CPU-bound per-post batches.
+
+AI optimization and post page rendering both map a function over every post.
+`map_in_processes` runs such a batch across worker processes when that is
+worthwhile and possible, and returns None when the caller should run it
+serially instead.
+
+Workers are always forked. A forked worker inherits the modules the parent has
+already imported, so generator.py (whose import reads .env, validates the
+environment, creates posts/ and builds the AI manager) is never re-imported in
+a worker. Where fork is unavailable, batches run serially.
+
+Environment hooks:
+- DEVTO_MIRROR_PARALLEL: set to "false" (or "0"/"no") to always run serially
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import pickle  # nosec B403 - only our own task payloads, within one build
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Below this many tasks, starting worker processes costs more than it saves.
+MIN_PARALLEL_BATCH = 32
+
+
+def parallel_enabled() -> bool:
+    """Whether DEVTO_MIRROR_PARALLEL allows process pools (on unless set to false/0/no)."""
+    return os.getenv("DEVTO_MIRROR_PARALLEL", "").lower() not in ("false", "0", "no")
+
+
+def _run_pickled(payload: bytes) -> Any:
+    fn, args = pickle.loads(payload)  # nosec B301 - payload pickled by map_in_processes
+    return fn(*args)
+
+
+def map_in_processes(
+    fn: Callable[..., Any],
+    arg_tuples: Sequence[tuple],
+    *,
+    max_workers: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+    chunksize: int = 1,
+    label: str = "batch",
+) -> list | None:
+    """Return [fn(*args) for args in arg_tuples] computed in worker processes.
+
+    Returns None when the batch should run serially: parallelism is disabled,
+    the batch is smaller than MIN_PARALLEL_BATCH or would get a single worker,
+    fork is unavailable, a task cannot be pickled, the pool fails to start, or a
+    worker dies. Any exception raised by fn itself propagates unchanged.
+
+    Tasks are pickled here, before anything is submitted, so a pickling failure
+    (PicklingError, or the TypeError/AttributeError raised for locks, lambdas and
+    local functions) is never mistaken for an error raised inside a worker.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(arg_tuples))
+    if workers <= 1 or len(arg_tuples) < MIN_PARALLEL_BATCH or not parallel_enabled():
+        return None
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return None
+
+    try:
+        payloads = [pickle.dumps((fn, tuple(args))) for args in arg_tuples]
+    except (pickle.PicklingError, TypeError, AttributeError) as e:
+        logger.warning("Parallel %s unavailable (cannot pickle task), running serially: %s", label, e)
+        return None
+
+    try:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=initializer,
+            initargs=initargs,
+        )
+    except OSError as e:
+        logger.warning("Parallel %s unavailable (pool failed to start), running serially: %s", label, e)
+        return None
+
+    with executor:
+        try:
+            results = executor.map(_run_pickled, payloads, chunksize=chunksize)
+        except OSError as e:
+            logger.warning("Parallel %s unavailable (pool failed to start), running serially: %s", label, e)
+            return None
+        try:
+            return list(results)
+        except BrokenProcessPool as e:
+            logger.warning("Parallel %s unavailable (worker died), running serially: %s", label, e)
+            return None
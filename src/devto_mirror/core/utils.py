@@ -2,9 +2,12 @@
 Shared utilities for devto-mirror scripts
 """
 
+import functools
 import json
+import logging
 import os
 import pathlib
+import re
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 
@@ -64,8 +67,6 @@ def get_post_template():
             return env.get_template("post_template.html")
     except Exception as e:
         # Log the error but continue with fallback
-        import logging
-
         logging.debug(f"Failed to load post template from file: {e}")
 
     # Fallback to inline template
@@ -282,6 +283,19 @@ def _parse_iso_date_str(s: str) -> datetime:
     return datetime.fromisoformat(s)
 
 
+def _parse_naive_iso_str(s: str) -> datetime:
+    """Parse a basic ISO timestamp without timezone."""
+    return datetime.strptime(s, "%Y-%m-%dT%H:%M:%S")
+
+
+# Strings that start like an ISO date are tried as ISO first; anything else
+# (e.g. RFC 2822 "Mon, 01 Jan 2024 ...") goes to the RFC parser first, so
+# neither common format pays for a raised-and-caught ValueError.
+_ISO_DATE_PREFIX_RE = re.compile(r"\d{4}-?\d{2}")
+_ISO_FIRST_PARSERS = (_parse_iso_date_str, parsedate_to_datetime, _parse_naive_iso_str)
+_RFC_FIRST_PARSERS = (parsedate_to_datetime, _parse_iso_date_str, _parse_naive_iso_str)
+
+
 def parse_date(date_str):
     """
     Unified date parsing function that handles various formats.
@@ -306,17 +320,18 @@ def parse_date(date_str):
         except Exception:
             return None
 
-    s = str(date_str).strip()
+    return _parse_date_str(str(date_str).strip())
 
-    # Try different parsing formats in order
-    formats_to_try = [
-        # ISO format with Z
-        _parse_iso_date_str,
-        # RFC-style parse
-        parsedate_to_datetime,
-        # Basic ISO without timezone
-        lambda s: datetime.strptime(s, "%Y-%m-%dT%H:%M:%S"),
-    ]
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str(s: str):
+    """
+    Parse a date string into a timezone-aware datetime, or None.
+
+    Memoized: dedupe and sorting parse the same handful of timestamps per post
+    repeatedly, and the result (an immutable datetime) is safe to share.
+    """
+    formats_to_try = _ISO_FIRST_PARSERS if _ISO_DATE_PREFIX_RE.match(s) else _RFC_FIRST_PARSERS
 
     for parse_func in formats_to_try:
         try:
@@ -330,9 +345,15 @@ def parse_date(date_str):
     return None
 
 
+def _api_data_of(post_dict: dict) -> dict:
+    """Return the post's api_data dict, or an empty dict if missing/malformed."""
+    api_data = post_dict.get("api_data")
+    return api_data if isinstance(api_data, dict) else {}
+
+
 def _post_identity_key(post_dict: dict) -> str | None:
     """Return a stable identity key for a post dict (id-based or link-based)."""
-    api_data = post_dict.get("api_data") if isinstance(post_dict.get("api_data"), dict) else {}
+    api_data = _api_data_of(post_dict)
     try:
         post_id = int(post_dict.get("id") or api_data.get("id") or 0)
     except (TypeError, ValueError):
@@ -340,9 +361,7 @@ def _post_identity_key(post_dict: dict) -> str | None:
     if post_id:
         return f"id:{post_id}"
 
-    link = (post_dict.get("link") or "").strip()
-    if link.endswith("/"):
-        link = link[:-1]
+    link = (post_dict.get("link") or "").strip().removesuffix("/")
     if link:
         return f"link:{link}"
     return None
@@ -350,7 +369,7 @@ def _post_identity_key(post_dict: dict) -> str | None:
 
 def _post_activity_dt(post_dict: dict) -> datetime | None:
     """Return the most recent activity datetime for a post dict."""
-    api_data = post_dict.get("api_data") if isinstance(post_dict.get("api_data"), dict) else {}
+    api_data = _api_data_of(post_dict)
     candidates = [
         api_data.get("edited_at"),
         api_data.get("updated_at"),
@@ -383,10 +402,8 @@ def _merge_post_dicts(*, primary: dict, secondary: dict) -> dict:
             merged[field] = secondary[field]
 
     # Merge api_data shallowly; primary wins on conflicts.
-    primary_api = primary.get("api_data") if isinstance(primary.get("api_data"), dict) else {}
-    secondary_api = secondary.get("api_data") if isinstance(secondary.get("api_data"), dict) else {}
-    merged_api = dict(secondary_api)
-    merged_api.update(primary_api)
+    merged_api = dict(_api_data_of(secondary))
+    merged_api.update(_api_data_of(primary))
     merged["api_data"] = merged_api
     return merged
 
@@ -414,7 +431,10 @@ def dedupe_posts_by_link(posts_list):
     if not posts_list:
         return []
 
+    # key -> (activity datetime, post dict); the datetime is carried along so
+    # each kept post is only re-evaluated when a merge changes its fields.
     posts_map = {}
+    fallback = datetime.min.replace(tzinfo=timezone.utc)
 
     for post in posts_list:
         post_dict = post.to_dict() if hasattr(post, "to_dict") else post
@@ -429,16 +449,17 @@ def dedupe_posts_by_link(posts_list):
 
         existing = posts_map.get(key)
         if existing is None:
-            posts_map[key] = post_dict
+            posts_map[key] = (incoming_dt, post_dict)
             continue
 
-        existing_dt = _post_activity_dt(existing)
+        existing_dt, existing_dict = existing
         if incoming_dt and (not existing_dt or incoming_dt > existing_dt):
             # Incoming is newer: keep it, but don't drop missing fields.
-            posts_map[key] = _merge_post_dicts(primary=post_dict, secondary=existing)
+            merged = _merge_post_dicts(primary=post_dict, secondary=existing_dict)
         else:
             # Existing stays, but it may be missing fields that incoming has.
-            posts_map[key] = _merge_post_dicts(primary=existing, secondary=post_dict)
+            merged = _merge_post_dicts(primary=existing_dict, secondary=post_dict)
+        posts_map[key] = (_post_activity_dt(merged), merged)
 
-    deduped = sorted(posts_map.values(), key=_post_date_sort_key, reverse=True)
-    return deduped
+    ranked = sorted(posts_map.values(), key=lambda entry: entry[0] or fallback, reverse=True)
+    return [post_dict for _, post_dict in ranked]
@@ -1,4 +1,6 @@
-import html
+import functools
+import hashlib
+import inspect
 import json
 import logging
 import os
@@ -7,28 +9,36 @@ import re
 import sys
 from datetime import datetime
 
-import bleach
 from dotenv import load_dotenv
 from jinja2 import Environment, select_autoescape
 from slugify import slugify
 
 from devto_mirror.core.article_fetcher import fetch_all_articles_from_api
 from devto_mirror.core.constants import POSTS_DATA_FILE
-from devto_mirror.core.html_sanitization import sanitize_html_content
+from devto_mirror.core.html_sanitization import sanitize_html_content, sanitizer_fingerprint, strip_html_tags
+from devto_mirror.core.json_utils import dump_json_file, load_json_file
 from devto_mirror.core.path_utils import sanitize_filename, sanitize_slug, validate_safe_path
+from devto_mirror.core.process_pool import map_in_processes
 from devto_mirror.core.run_state import get_last_run_timestamp, mark_no_new_posts, set_last_run_timestamp
 from devto_mirror.core.url_utils import build_site_urls
 from devto_mirror.core.utils import (
+    FIREBASE_SDK_VERSION,
     INDEX_TMPL,
+    POST_TEMPLATE_INLINE,
     SITEMAP_TMPL,
     dedupe_posts_by_link,
     firebase_analytics_snippet,
     get_post_template,
+    template_dir,
 )
 
 # Import AI optimization components
 try:
-    from devto_mirror.ai_optimization import create_default_ai_optimization_manager, enhance_post_with_cross_references
+    from devto_mirror.ai_optimization import (
+        create_default_ai_optimization_manager,
+        enhance_post_with_cross_references,
+        enhance_posts_with_cross_references,
+    )
 
     AI_OPTIMIZATION_AVAILABLE = True
 except ImportError as e:
@@ -62,6 +72,10 @@ _site_urls = build_site_urls(
 HOME = _site_urls.home
 ROOT_HOME = _site_urls.root_home
 
+# Render context shared by every page; computed once instead of per render call.
+SITE_NAME = f"{DEVTO_USERNAME}—Dev.to Mirror"
+DEFAULT_SOCIAL_IMAGE = f"{HOME}assets/devto-mirror.jpg"
+
 ROOT = pathlib.Path(".")
 POSTS_DIR = ROOT / "posts"
 POSTS_DIR.mkdir(parents=True, exist_ok=True)
@@ -70,8 +84,7 @@ POSTS_DIR.mkdir(parents=True, exist_ok=True)
 ai_manager = None
 if AI_OPTIMIZATION_AVAILABLE:
     try:
-        site_name = f"{DEVTO_USERNAME}—Dev.to Mirror"
-        ai_manager = create_default_ai_optimization_manager(site_name, HOME)
+        ai_manager = create_default_ai_optimization_manager(SITE_NAME, HOME)
         logging.info("AI optimization manager initialized successfully")
     except Exception as e:
         logging.warning(f"Failed to initialize AI optimization manager: {e}")
@@ -90,6 +103,22 @@ env.globals["firebase_analytics"] = firebase_analytics_snippet
 # Get the post template (from file or inline fallback)
 PAGE_TMPL = get_post_template()
 
+
+def _page_template_fingerprint() -> str:
+    template_file = template_dir / "post_template.html"
+    source = template_file.read_bytes() if template_file.exists() else POST_TEMPLATE_INLINE.encode("utf-8")
+    digest = hashlib.sha256(source)
+    digest.update(f"\0{FIREBASE_SDK_VERSION}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+# Each post page starts with a hash of its render inputs so unchanged posts can be
+# skipped on the next run. Besides the post's context, the hash covers the template
+# source, the analytics snippet, the sanitizer (sanitizer_fingerprint) and the code in
+# _PAGE_POST_PROCESSING: changing any of them re-renders everything.
+PAGE_TMPL_FINGERPRINT = _page_template_fingerprint()
+GENHASH_PREFIX = "<!-- genhash:"
+
 COMMENT_NOTE_TMPL = env.from_string("""<!doctype html><html lang="en"><head>
 <meta charset="utf-8">
 <title>{{ title }}</title>
@@ -156,15 +185,20 @@ def strip_html(text):
     """Remove HTML tags and normalize whitespace using bleach."""
     if not text:
         return ""
-    cleaned = bleach.clean(text, tags=[], strip=True)
+    cleaned = strip_html_tags(text)
     return " ".join(cleaned.split()).strip()
 
 
+# <img> patterns used by ensure_img_dimensions. Attribute patterns accept either
+# single or double quotes, and arbitrary whitespace.
+_IMG_TAG_RE = re.compile(r"<img\b[^>]*>", re.IGNORECASE)
+_IMG_WIDTH_RE = re.compile(r"\bwidth\s*=\s*(['\"])\d+\1", re.IGNORECASE)
+_IMG_HEIGHT_RE = re.compile(r"\bheight\s*=\s*(['\"])\d+\1", re.IGNORECASE)
+_IMG_SRC_RE = re.compile(r"\bsrc\s*=\s*(['\"])(.*?)\1", re.IGNORECASE)
+
+
 def _img_tag_has_dimensions(tag: str) -> bool:
-    # Accept either single or double quotes, and arbitrary whitespace.
-    has_width = re.search(r"\bwidth\s*=\s*(['\"])\d+\1", tag, flags=re.IGNORECASE)
-    has_height = re.search(r"\bheight\s*=\s*(['\"])\d+\1", tag, flags=re.IGNORECASE)
-    return bool(has_width and has_height)
+    return bool(_IMG_WIDTH_RE.search(tag) and _IMG_HEIGHT_RE.search(tag))
 
 
 def _choose_img_size_for_src(*, src_val: str, cover_src: str | None) -> tuple[int, int]:
@@ -202,15 +236,51 @@ def ensure_img_dimensions(content: str, cover_src: str | None = None) -> str:
         if _img_tag_has_dimensions(tag):
             return tag
 
-        src_match = re.search(r"\bsrc\s*=\s*(['\"])(.*?)\1", tag, flags=re.IGNORECASE)
+        src_match = _IMG_SRC_RE.search(tag)
         src_val = src_match.group(2) if src_match else ""
         width, height = _choose_img_size_for_src(src_val=src_val, cover_src=cover_src)
         return _add_img_dimensions_to_tag(tag=tag, width=width, height=height)
 
-    return re.sub(r"<img\b[^>]*>", _replacer, content, flags=re.IGNORECASE)
+    return _IMG_TAG_RE.sub(_replacer, content)
+
+
+# Path segment after the username: the full slug with ID in
+# https://dev.to/username/full-slug-with-id. Query strings and fragments are not part
+# of the slug; an empty segment (".../username/" or ".../username//x") captures "".
+_URL_SLUG_RE = re.compile(r"^[^:]+://[^/]+/[^/]+/([^/?#]*)")
+
+# Comment id from a Dev.to comment URL: the /comment/<id> path, else a #comment-<id> fragment.
+_COMMENT_PATH_ID_RE = re.compile(r"/comment/([A-Za-z0-9]+)")
+_COMMENT_FRAGMENT_ID_RE = re.compile(r"#comment-([A-Za-z0-9_-]+)")
+
+
+def _derive_slug(link, api_data: dict, title: str) -> str:
+    """Post slug from its Dev.to URL, falling back to the API slug, then the title.
+
+    The title is only slugified when a fallback actually needs it.
+    """
+    match = _URL_SLUG_RE.match(link) if isinstance(link, str) else None
+    if match:
+        return sanitize_slug(match.group(1), max_length=120) or slugify(title) or "post"
+    api_slug = api_data["slug"] if "slug" in api_data else (slugify(title) or "post")
+    return sanitize_filename(api_slug)
 
 
 class Post:
+    # One Post per article per run; slots keep each instance free of a __dict__.
+    __slots__ = (
+        "api_data",
+        "title",
+        "link",
+        "date",
+        "content_html",
+        "description",
+        "cover_image",
+        "author",
+        "tags",
+        "slug",
+    )
+
     def __init__(self, api_data):
         # Store the original API data for AI optimization
         self.api_data = api_data
@@ -237,21 +307,8 @@ class Post:
 
         # Extract the full slug from the URL instead of using the API's slug field
         # Dev.to URLs have format: https://dev.to/username/full-slug-with-id
-        if self.link and "//" in self.link:
-            try:
-                # Extract the path part after the username
-                url_path = self.link.split("//")[1]  # Remove protocol
-                path_parts = url_path.split("/")
-                if len(path_parts) >= 3:  # domain, username, slug
-                    raw_slug = path_parts[2]  # The full slug with ID
-                    sanitized = sanitize_slug(raw_slug, max_length=120)
-                    self.slug = sanitized or slugify(self.title) or "post"
-                else:
-                    self.slug = sanitize_filename(api_data.get("slug", slugify(self.title) or "post"))
-            except Exception:
-                self.slug = sanitize_filename(api_data.get("slug", slugify(self.title) or "post"))
-        else:
-            self.slug = sanitize_filename(api_data.get("slug", slugify(self.title) or "post"))
+        # (from_dict restores the stored slug and never re-derives it)
+        self.slug = _derive_slug(self.link, api_data, self.title)
 
     def _normalize_tags(self, tags):
         """
@@ -291,8 +348,12 @@ class Post:
         date_val = self.date
         if isinstance(self.date, datetime):
             date_val = self.date.isoformat()
+        api_data = getattr(self, "api_data", {}) or {}
+        if "body_html" in api_data:
+            # content_html already holds the body; don't persist it a second time.
+            api_data = {key: value for key, value in api_data.items() if key != "body_html"}
         return {
-            "id": (getattr(self, "api_data", {}) or {}).get("id") or 0,
+            "id": api_data.get("id") or 0,
             "title": self.title,
             "link": self.link,
             "date": date_val,
@@ -302,7 +363,7 @@ class Post:
             "cover_image": self.cover_image,
             "tags": self.tags,
             "author": getattr(self, "author", DEVTO_USERNAME),
-            "api_data": getattr(self, "api_data", {}),  # Store original API data
+            "api_data": api_data,  # Store original API data (minus the duplicate body)
         }
 
     @classmethod
@@ -335,7 +396,7 @@ def load_comment_manifest(path="comments.txt"):
         url, *ctx = [s.strip() for s in line.split("|", 1)]
         context = ctx[0] if ctx else ""
         # get a stable id from /comment/<id> or #comment-<id>, else slug of URL
-        m = re.search(r"/comment/([A-Za-z0-9]+)", url) or re.search(r"#comment-([A-Za-z0-9_-]+)", url)
+        m = _COMMENT_PATH_ID_RE.search(url) or _COMMENT_FRAGMENT_ID_RE.search(url)
         cid = m.group(1) if m else slugify(url)[:48]
         # Sanitize only the filename component (cid) to prevent path traversal
         sanitized_cid = sanitize_filename(cid)
@@ -354,10 +415,9 @@ def load_existing_posts(path=POSTS_DATA_FILE):
     if not p.exists():
         return []
     try:
-        with open(p, "r", encoding="utf-8") as f:
-            posts_data = json.load(f)
-            # Convert dicts to Post instances (avoid re-parsing RSS entries)
-            return [Post.from_dict(post_dict) for post_dict in posts_data]
+        posts_data = load_json_file(p)
+        # Convert dicts to Post instances (avoid re-parsing RSS entries)
+        return [Post.from_dict(post_dict) for post_dict in posts_data]
     except (json.JSONDecodeError, KeyError):
         return []
 
@@ -365,8 +425,7 @@ def load_existing_posts(path=POSTS_DATA_FILE):
 def save_posts_data(posts, path=POSTS_DATA_FILE):
     """Save posts to JSON file"""
     posts_data = [post.to_dict() if hasattr(post, "to_dict") else post for post in posts]
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(posts_data, f, indent=2, ensure_ascii=False)
+    dump_json_file(path, posts_data)
 
 
 def is_first_run():
@@ -424,17 +483,30 @@ def _merge_posts(
     force_full_regen: bool,
     fetch_success: bool,
     fetch_source: str,
-) -> tuple[list["Post"], list[dict]]:
+) -> tuple[list["Post"], list["Post"]]:
     if force_full_regen and fetch_success and fetch_source == "api":
         delta_posts = candidate_posts
-        all_posts_data = [p.to_dict() for p in candidate_posts]
+        merged_posts = list(candidate_posts)
     else:
         # Incremental mode: candidate_posts are "new or updated since last run".
         # Merge them into the existing store and let the deduper pick the latest version.
         delta_posts = candidate_posts
-        all_posts_data = [p.to_dict() for p in existing_posts_data]
-        all_posts_data.extend([p.to_dict() for p in delta_posts])
-    return delta_posts, all_posts_data
+        merged_posts = [*existing_posts_data, *delta_posts]
+    return delta_posts, merged_posts
+
+
+def _dedupe_posts(posts: list["Post"]) -> tuple[list[dict], list["Post"]]:
+    """Deduplicate and sort posts newest first, returning (dicts to save, Posts to render).
+
+    dedupe_posts_by_link hands back the very dict it was given for every post that
+    was not merged with a duplicate, so those keep their Post object; only merged
+    entries are rebuilt with Post.from_dict.
+    """
+    source_dicts = [p.to_dict() for p in posts]
+    post_by_dict_id = {id(d): p for d, p in zip(source_dicts, posts)}
+    posts_data = dedupe_posts_by_link(source_dicts)
+    # source_dicts is still alive here, so a merged dict can never reuse one of its ids.
+    return posts_data, [post_by_dict_id.get(id(d)) or Post.from_dict(d) for d in posts_data]
 
 
 def _log_post_summary(*, delta_posts: list["Post"], all_posts: list["Post"]) -> None:
@@ -457,7 +529,7 @@ def _canonical_for_post(post: "Post") -> str:
 
 def _social_image_for_post(post: "Post") -> str:
     # Use cover image as social image, fallback to default banner
-    return post.cover_image or f"{HOME}assets/devto-mirror.jpg"
+    return post.cover_image or DEFAULT_SOCIAL_IMAGE
 
 
 def _try_ai_enhancements(post: "Post", all_posts: list["Post"]) -> tuple[dict, dict]:
@@ -473,6 +545,27 @@ def _try_ai_enhancements(post: "Post", all_posts: list["Post"]) -> tuple[dict, d
         return {}, {}
 
 
+def _batch_ai_enhancements(all_posts: list["Post"]) -> list[tuple[dict, dict]]:
+    """AI optimization and cross references for every post, in all_posts order.
+
+    Shared work (worker setup, the related-posts tag index) is done once for the
+    batch. If the batch fails, each post is retried on its own so one bad post
+    only loses its own enhancements.
+    """
+    if not ai_manager:
+        return [({}, {}) for _ in all_posts]
+    try:
+        optimizations = ai_manager.optimize_posts(all_posts, all_posts=all_posts)
+        cross_references = enhance_posts_with_cross_references(all_posts, all_posts)
+    except Exception as e:
+        logging.warning(f"Batch AI optimization failed, retrying per post: {e}")
+        return [_try_ai_enhancements(p, all_posts) for p in all_posts]
+
+    for p in all_posts:
+        print(f"Applied AI optimizations to: {p.slug}")
+    return list(zip(optimizations, cross_references))
+
+
 def _renderable_content_html(post: "Post") -> str:
     # Ensure images have dimensions and improve color contrast in inline styles in content
     content_html = post.content_html or ""
@@ -500,6 +593,92 @@ def _maybe_remove_old_slug_file(*, post: "Post", new_safe_slug: str, existing_sl
         print(f"Removed old slug file for {post_id}: {old_safe_slug}.html")
 
 
+def _render_hash(context: dict) -> str:
+    # The analytics snippet is a template global read from FIREBASE_WEB_CONFIG at
+    # render time, so it is hashed alongside the per-page context.
+    code = [PAGE_TMPL_FINGERPRINT, sanitizer_fingerprint(), _post_processing_fingerprint()]
+    payload = json.dumps([code, str(firebase_analytics_snippet()), context], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _existing_render_hash(path: pathlib.Path) -> str | None:
+    try:
+        with open(path, "rb") as f:
+            first_line = f.readline(128)
+    except OSError:
+        return None
+    prefix = GENHASH_PREFIX.encode("ascii")
+    if not first_line.startswith(prefix):
+        return None
+    return first_line[len(prefix) :].split(b" ", 1)[0].decode("ascii", errors="replace")
+
+
+def _post_page_job(
+    *,
+    post: "Post",
+    canonical: str,
+    social_image: str,
+    optimization_data: dict,
+    cross_references: dict,
+    force: bool = False,
+) -> tuple["Post", dict, str, pathlib.Path] | None:
+    """Plan a post page as (post, context, render_hash, out_path); None when the existing page is current."""
+    context = {
+        "title": post.title,
+        "canonical": canonical,
+        "description": post.description or "",
+        "date": post.date,
+        "cover_image": post.cover_image,
+        "tags": getattr(post, "tags", []),
+        "social_image": social_image,
+        "site_name": SITE_NAME,
+        "author": post.author,
+        "enhanced_metadata": optimization_data.get("enhanced_metadata", {}),
+        "json_ld_schemas": optimization_data.get("json_ld_schemas", []),
+        "cross_references": cross_references,
+    }
+    # Hash the raw body: sanitizing it is the expensive part we want to skip.
+    render_hash = _render_hash({**context, "content_html": post.content_html or ""})
+    safe_slug = sanitize_slug(post.slug, max_length=120)
+    out_path = POSTS_DIR / f"{safe_slug}.html"
+    if not force and _existing_render_hash(out_path) == render_hash:
+        return None
+    return post, context, render_hash, out_path
+
+
+def _render_post_page(post: "Post", context: dict) -> str:
+    """Sanitize and render one post page. Module-level so it can run in a worker process."""
+    return PAGE_TMPL.render(content=sanitize_html_content(_renderable_content_html(post) or ""), **context)
+
+
+# Every step that transforms a post body on its way into the page. Their source is
+# hashed into each page's genhash, so a new step must be listed here too.
+_PAGE_POST_PROCESSING = (
+    _render_post_page,
+    _renderable_content_html,
+    ensure_img_dimensions,
+    _img_tag_has_dimensions,
+    _choose_img_size_for_src,
+    _add_img_dimensions_to_tag,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _post_processing_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for step in _PAGE_POST_PROCESSING:
+        digest.update(inspect.getsource(step).encode("utf-8"))
+    for pattern in (_IMG_TAG_RE, _IMG_WIDTH_RE, _IMG_HEIGHT_RE, _IMG_SRC_RE):
+        digest.update(pattern.pattern.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _store_post_page(job: tuple["Post", dict, str, pathlib.Path], html_out: str) -> None:
+    post, context, render_hash, out_path = job
+    out_path.write_bytes(f"{GENHASH_PREFIX}{render_hash} -->\n{html_out}".encode("utf-8"))
+    print(f"Wrote: {post.slug}.html (canonical: {context['canonical']})")
+
+
 def _write_post_html(
     *,
     post: "Post",
@@ -507,25 +686,39 @@ def _write_post_html(
     social_image: str,
     optimization_data: dict,
     cross_references: dict,
-) -> None:
-    html_out = PAGE_TMPL.render(
-        title=post.title,
+    force: bool = False,
+) -> bool:
+    """Render and write a post page; return False when the existing page is current."""
+    job = _post_page_job(
+        post=post,
         canonical=canonical,
-        description=html.escape(post.description or ""),
-        date=post.date,
-        content=sanitize_html_content(_renderable_content_html(post) or ""),
-        cover_image=post.cover_image,
-        tags=getattr(post, "tags", []),
         social_image=social_image,
-        site_name=f"{DEVTO_USERNAME}—Dev.to Mirror",
-        author=post.author,
-        enhanced_metadata=optimization_data.get("enhanced_metadata", {}),
-        json_ld_schemas=optimization_data.get("json_ld_schemas", []),
+        optimization_data=optimization_data,
         cross_references=cross_references,
+        force=force,
     )
-    safe_slug = sanitize_slug(post.slug, max_length=120)
-    (POSTS_DIR / f"{safe_slug}.html").write_text(html_out, encoding="utf-8")
-    print(f"Wrote: {post.slug}.html (canonical: {canonical})")
+    if job is None:
+        return False
+    _store_post_page(job, _render_post_page(job[0], job[1]))
+    return True
+
+
+def _write_post_pages(jobs: list[tuple["Post", dict, str, pathlib.Path]], max_workers: int | None = None) -> None:
+    """Render planned post pages across processes, then write them in order.
+
+    Sanitizing and rendering are CPU-bound and independent per post. Only the post,
+    its context and the rendered HTML cross the process boundary. Small batches,
+    DEVTO_MIRROR_PARALLEL=false, and batches the pool cannot take run serially
+    instead (see map_in_processes); errors raised while rendering a page propagate.
+    """
+    pages = map_in_processes(
+        _render_post_page, [(job[0], job[1]) for job in jobs], max_workers=max_workers, label="page rendering"
+    )
+    if pages is None:
+        pages = [_render_post_page(job[0], job[1]) for job in jobs]
+
+    for job, html_out in zip(jobs, pages):
+        _store_post_page(job, html_out)
 
 
 def _write_comment_notes(*, comment_items: list[dict], site_author: str) -> None:
@@ -533,24 +726,25 @@ def _write_comment_notes(*, comment_items: list[dict], site_author: str) -> None
         return
 
     pathlib.Path("comments").mkdir(exist_ok=True)
+    comments_dir = pathlib.Path("comments").resolve()
+    # Context shared by every comment note
+    base_context = {
+        "title": "Comment note",
+        "social_image": DEFAULT_SOCIAL_IMAGE,
+        "site_name": SITE_NAME,
+        "author": site_author,
+        "enhanced_metadata": {},  # Comments don't have enhanced metadata yet
+    }
     for c in comment_items:
-        title = "Comment note"
         desc = (c["context"] or "Comment note").strip()[:300]
 
-        # Default social image
-        social_image = f"{HOME}assets/devto-mirror.jpg"
-
         # For comment notes, canonical should point back to the original Dev.to URL
         html_page = COMMENT_NOTE_TMPL.render(
-            title=html.escape(title),
+            base_context,
             canonical=c["url"],
-            description=html.escape(desc),
-            context=html.escape(c["context"]) if c["context"] else "",
+            description=desc,
+            context=c["context"] or "",
             url=c["url"],
-            social_image=social_image,
-            site_name=f"{DEVTO_USERNAME}—Dev.to Mirror",
-            author=site_author,
-            enhanced_metadata={},  # Comments don't have enhanced metadata yet
         )
         # Ensure local path is safe. Re-sanitize the filename component to be defensive
         # (load_comment_manifest already attempts sanitization, but double-check here).
@@ -559,11 +753,14 @@ def _write_comment_notes(*, comment_items: list[dict], site_author: str) -> None
         sanitized_local = sanitize_filename(name) + ext
         local_path = validate_safe_path(pathlib.Path("comments"), sanitized_local)
         resolved_path = local_path.resolve()
-        comments_dir = pathlib.Path("comments").resolve()
         if not str(resolved_path).startswith(str(comments_dir) + os.sep):
             raise ValueError(f"Path traversal detected in comment local path: {c['local']}")
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        local_path.write_text(html_page, encoding="utf-8")
+        # Leave unchanged notes untouched so their mtime (and any downstream cache) survives.
+        data = html_page.encode("utf-8")
+        if local_path.exists() and local_path.read_bytes() == data:
+            continue
+        local_path.write_bytes(data)
 
 
 def _write_index_page(*, all_posts: list["Post"], comment_items: list[dict]) -> None:
@@ -572,8 +769,6 @@ def _write_index_page(*, all_posts: list["Post"], comment_items: list[dict]) ->
         f"Mirror of {DEVTO_USERNAME}'s Dev.to blog posts. "
         "Canonical lives on Dev.to. This is just a crawler-friendly mirror."
     )
-    social_image = f"{HOME}assets/devto-mirror.jpg"
-
     index_html = INDEX_TMPL.render(
         username=DEVTO_USERNAME,
         posts=all_posts,
@@ -581,9 +776,9 @@ def _write_index_page(*, all_posts: list["Post"], comment_items: list[dict]) ->
         home=HOME,
         canonical=devto_profile,
         site_description=site_description,
-        social_image=social_image,
+        social_image=DEFAULT_SOCIAL_IMAGE,
     )
-    pathlib.Path("index.html").write_text(index_html, encoding="utf-8")
+    pathlib.Path("index.html").write_bytes(index_html.encode("utf-8"))
 
 
 def _write_sitemap(*, all_posts: list["Post"], comment_items: list[dict]) -> None:
@@ -602,7 +797,7 @@ def _write_sitemap(*, all_posts: list["Post"], comment_items: list[dict]) -> Non
         sitemap_content = SITEMAP_TMPL.render(home=HOME, posts=all_posts, comments=comment_items)
         print("Generated standard sitemap")
 
-    pathlib.Path("sitemap.xml").write_text(sitemap_content, encoding="utf-8")
+    pathlib.Path("sitemap.xml").write_bytes(sitemap_content.encode("utf-8"))
 
 
 # ----------------------------
@@ -628,7 +823,7 @@ def main():
 
     candidate_posts = [Post(article) for article in fetch_result.articles]
 
-    delta_posts, all_posts_data = _merge_posts(
+    delta_posts, merged_posts = _merge_posts(
         existing_posts_data=existing_posts_data,
         candidate_posts=candidate_posts,
         force_full_regen=force_full_regen,
@@ -637,10 +832,7 @@ def main():
     )
 
     # Deduplicate and sort all posts by date, newest first
-    all_posts_data = dedupe_posts_by_link(all_posts_data)
-
-    # Convert dicts back to Post objects for rendering
-    all_posts = [Post.from_dict(p) for p in all_posts_data]
+    all_posts_data, all_posts = _dedupe_posts(merged_posts)
 
     _log_post_summary(delta_posts=delta_posts, all_posts=all_posts)
 
@@ -649,21 +841,31 @@ def main():
     # Generate (or regenerate) HTML files for all posts and ensure the
     # page <link rel="canonical"> matches the feed-provided URL saved in
     # posts_data.json (RSS is source-of-truth).
-    for p in all_posts:
+    unchanged = 0
+    jobs = []
+    enhancements = _batch_ai_enhancements(all_posts)
+    for p, (optimization_data, cross_references) in zip(all_posts, enhancements):
         canonical = _canonical_for_post(p)
         social_image = _social_image_for_post(p)
-        optimization_data, cross_references = _try_ai_enhancements(p, all_posts)
         safe_slug = sanitize_slug(p.slug, max_length=120)
 
         # If a post's slug changes on DEV (URL change), avoid leaving a stale orphan file behind.
         _maybe_remove_old_slug_file(post=p, new_safe_slug=safe_slug, existing_slug_by_id=existing_slug_by_id)
-        _write_post_html(
+        job = _post_page_job(
             post=p,
             canonical=canonical,
             social_image=social_image,
             optimization_data=optimization_data,
             cross_references=cross_references,
+            force=force_full_regen,
         )
+        if job is None:
+            unchanged += 1
+        else:
+            jobs.append(job)
+    _write_post_pages(jobs)
+    if unchanged:
+        print(f"Skipped {unchanged} unchanged post pages")
 
     # Save the updated posts data for next run
     save_posts_data(all_posts_data)
@@ -1,4 +1,3 @@
-import json
 import os
 import pathlib
 import re
@@ -7,19 +6,23 @@ import urllib.parse
 
 from slugify import slugify
 
+from devto_mirror.core.json_utils import dump_json_file, load_json_file
 from devto_mirror.core.url_utils import build_site_urls
 from devto_mirror.core.utils import INDEX_TMPL, SITEMAP_TMPL, dedupe_posts_by_link
 
 ROOT = pathlib.Path(".")
 
+# Comment id from a Dev.to comment URL: the /comment/<id> path, else a #comment-<id> fragment.
+_COMMENT_PATH_ID_RE = re.compile(r"/comment/([A-Za-z0-9]+)")
+_COMMENT_FRAGMENT_ID_RE = re.compile(r"#comment-([A-Za-z0-9_-]+)")
+
 
 def load_posts_data(path="posts_data.json"):
     p = ROOT / path
     if not p.exists():
         return []
     try:
-        with p.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(p)
     except Exception:
         return []
 
@@ -27,8 +30,7 @@ def load_posts_data(path="posts_data.json"):
 def save_posts_data(posts, path="posts_data.json"):
     p = ROOT / path
     try:
-        with p.open("w", encoding="utf-8") as f:
-            json.dump(posts, f, indent=2, ensure_ascii=False)
+        dump_json_file(p, posts)
         return True
     except Exception:
         return False
@@ -46,7 +48,7 @@ def load_comment_manifest(path="comments.txt"):
         url, *ctx = [s.strip() for s in line.split("|", 1)]
         context = ctx[0] if ctx else ""
         # normalize comment id from URL fragment or path
-        m = re.search(r"/comment/([A-Za-z0-9]+)", url) or re.search(r"#comment-([A-Za-z0-9_-]+)", url)
+        m = _COMMENT_PATH_ID_RE.search(url) or _COMMENT_FRAGMENT_ID_RE.search(url)
         cid = m.group(1) if m else slugify(url)[:48]
         local = f"comments/{cid}.html"
         label = context or url
@@ -61,8 +63,7 @@ def load_and_merge_posts():
     new_path = ROOT / "posts_data_new.json"
     if new_path.exists():
         try:
-            with new_path.open("r", encoding="utf-8") as f:
-                new_posts = json.load(f)
+            new_posts = load_json_file(new_path)
         except Exception:
             new_posts = []
         if new_posts:
@@ -66,6 +66,17 @@ class TestCreateDevtoSession(unittest.TestCase):
 
         self.assertNotIn("api-key", self.session.headers)
 
+    @patch.dict("os.environ", {}, clear=True)
+    def test_https_adapter_pool_covers_concurrent_fetches(self):
+        """Test that the mounted HTTPS adapter keeps enough connections for concurrent article fetches."""
+        from devto_mirror.core.article_fetcher import FULL_ARTICLE_MAX_WORKERS
+
+        self.session = create_devto_session()
+        adapter = self.session.get_adapter("https://dev.to/api/articles")
+
+        self.assertGreaterEqual(adapter._pool_maxsize, FULL_ARTICLE_MAX_WORKERS)
+        self.assertEqual(adapter.max_retries.total, 0)
+
 
 class TestFetchPageWithRetry(unittest.TestCase):
     """Test cases for fetch_page_with_retry function."""
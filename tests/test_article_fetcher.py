@@ -242,6 +242,33 @@ class TestFetchFullArticles(unittest.TestCase):
         self.assertEqual(mock_sleep.call_count, 1)
         mock_sleep.assert_called_with(0.8)
 
+    @patch("devto_mirror.core.article_fetcher.create_devto_session")
+    @patch("devto_mirror.core.article_fetcher.time.sleep")
+    def test_results_keep_summary_order(self, mock_sleep, mock_create_session):
+        """Concurrent fetches are reported in summary order, with failures matched to their article."""
+        mock_create_session.return_value = MagicMock(spec=requests.Session)
+
+        def fake_fetch(_session, *, article_id):
+            return None if article_id == 2 else {"id": article_id}
+
+        summaries = [{"id": i} for i in range(1, 6)]
+        with patch("devto_mirror.core.article_fetcher._fetch_full_article_json", side_effect=fake_fetch):
+            full, failed = _fetch_full_articles(article_summaries=summaries)
+
+        self.assertEqual([a["id"] for a in full], [1, 3, 4, 5])
+        self.assertEqual(failed, [{"id": 2}])
+
+    @patch("devto_mirror.core.article_fetcher.create_devto_session")
+    @patch("devto_mirror.core.article_fetcher.time.sleep")
+    def test_caller_session_is_used_and_left_open(self, mock_sleep, mock_create_session):
+        """A session passed in by the caller is reused and not closed."""
+        session = MagicMock(spec=requests.Session)
+        with patch("devto_mirror.core.article_fetcher._fetch_full_article_json", return_value={"id": 1}) as mock_fetch:
+            _fetch_full_articles(article_summaries=[{"id": 1}], session=session)
+        mock_create_session.assert_not_called()
+        self.assertIs(mock_fetch.call_args[0][0], session)
+        session.close.assert_not_called()
+
 
 class TestFetchAllArticlesFromApi(unittest.TestCase):
     @patch.dict("os.environ", {"DEVTO_MIRROR_FORCE_EMPTY_FEED": "true"})
@@ -414,6 +441,25 @@ class TestFetchAllArticlesFromApi(unittest.TestCase):
         self.assertEqual(result.source, "cache")
         self.assertEqual(result.articles, [])
 
+    @patch("devto_mirror.core.article_fetcher.create_devto_session")
+    @patch("devto_mirror.core.article_fetcher._fetch_article_pages")
+    @patch("devto_mirror.core.article_fetcher._fetch_full_articles")
+    def test_pages_and_full_articles_share_one_session(self, mock_full, mock_pages, mock_create_session):
+        session = MagicMock(spec=requests.Session)
+        mock_create_session.return_value.__enter__.return_value = session
+        mock_pages.return_value = [{"id": 1}]
+        mock_full.return_value = ([{"id": 1}], [])
+        with tempfile.TemporaryDirectory() as td:
+            fetch_all_articles_from_api(
+                username="testuser",
+                last_run_iso=None,
+                posts_data_path=Path(td) / "posts_data.json",
+                validation_mode=False,
+            )
+        mock_create_session.assert_called_once()
+        self.assertIs(mock_pages.call_args.kwargs["session"], session)
+        self.assertIs(mock_full.call_args.kwargs["session"], session)
+
 
 if __name__ == "__main__":
     unittest.main()
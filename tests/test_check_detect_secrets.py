@@ -0,0 +1,55 @@
+"""
+Unit tests for the check_detect_secrets script.
+"""
+
+import subprocess  # nosec - needed for testing subprocess functionality
+import unittest
+from unittest.mock import MagicMock, patch
+
+from scripts import check_detect_secrets
+
+
+class TestChangedSince(unittest.TestCase):
+    """Test cases for the --changed-since incremental scan."""
+
+    @patch("scripts.check_detect_secrets.subprocess.run")
+    def test_changed_files_parses_git_output(self, mock_run):
+        """NUL-separated git diff output is split into file names."""
+        mock_run.return_value = MagicMock(stdout=b"src/a.py\0docs/b c.md\0")
+
+        files = check_detect_secrets._changed_files("origin/main")
+
+        self.assertEqual(files, ["src/a.py", "docs/b c.md"])
+        self.assertIn("origin/main", mock_run.call_args[0][0])
+
+    @patch("scripts.check_detect_secrets.subprocess.run")
+    def test_git_failure_falls_back_to_full_scan(self, mock_run):
+        """An unresolvable ref scans everything rather than nothing."""
+        mock_run.side_effect = subprocess.CalledProcessError(128, ["git", "diff"])
+
+        with patch("sys.stderr"):
+            self.assertEqual(check_detect_secrets._scan_paths("missing-ref"), [])
+
+    @patch("scripts.check_detect_secrets.subprocess.run")
+    def test_no_changes_skips_scan(self, mock_run):
+        """With nothing changed since the ref, detect-secrets is never invoked."""
+        mock_run.return_value = MagicMock(stdout=b"")
+
+        self.assertEqual(check_detect_secrets.main(["--changed-since", "HEAD"]), 0)
+        self.assertEqual(mock_run.call_count, 1)
+
+    @patch("scripts.check_detect_secrets.subprocess.run")
+    def test_changed_files_passed_to_scan(self, mock_run):
+        """Changed files are handed to detect-secrets ahead of the baseline flag."""
+        mock_run.side_effect = [
+            MagicMock(stdout=b"src/a.py\0"),
+            MagicMock(returncode=0, stdout='{"results": {}}', stderr=""),
+        ]
+
+        self.assertEqual(check_detect_secrets.main(["--changed-since", "HEAD"]), 0)
+        scan_cmd = mock_run.call_args_list[1][0][0]
+        self.assertEqual(scan_cmd[:4], ["detect-secrets", "scan", "src/a.py", "--baseline"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -91,6 +91,13 @@ class TestParseDate(unittest.TestCase):
         result = utils_module.parse_date(1704067200)
         self.assertIsNotNone(result)
 
+    def test_rfc_2822_string(self):
+        """RFC 2822 dates are routed to the RFC parser first and parse to aware datetimes."""
+        value = "Mon, 01 Jan 2024 10:00:00 +0000"
+        self.assertIsNone(utils_module._ISO_DATE_PREFIX_RE.match(value))
+        result = utils_module.parse_date(value)
+        self.assertEqual(result, datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc))
+
     def test_invalid_string_returns_none(self):
         result = utils_module.parse_date("not-a-date")
         self.assertIsNone(result)
@@ -100,6 +107,14 @@ class TestParseDate(unittest.TestCase):
         result = utils_module.parse_date(float("inf"))
         self.assertIsNone(result)
 
+    def test_string_parses_are_memoized(self):
+        """Repeated date strings are parsed once and share the cached result."""
+        utils_module._parse_date_str.cache_clear()
+        first = utils_module.parse_date("2024-03-01T08:00:00Z")
+        second = utils_module.parse_date(" 2024-03-01T08:00:00Z ")
+        self.assertIs(first, second)
+        self.assertEqual(utils_module._parse_date_str.cache_info().hits, 1)
+
 
 class TestPostIdentityKey(unittest.TestCase):
     def test_post_with_id_returns_id_key(self):
@@ -308,6 +323,21 @@ class TestDedupePostsByLink(unittest.TestCase):
         activity_1 = utils_module._post_activity_dt(result[1])
         self.assertGreaterEqual(activity_0, activity_1)
 
+    def test_activity_computed_once_per_post_and_merge(self):
+        """Activity timestamps are carried through the sort instead of being recomputed."""
+        posts = [
+            {"id": 1, "link": "https://example.com/a", "date": "2024-01-01T00:00:00Z"},
+            {"id": 2, "link": "https://example.com/b", "date": "2024-01-03T00:00:00Z"},
+            {"id": 1, "link": "https://example.com/a", "date": "2024-01-05T00:00:00Z"},
+        ]
+        with patch.object(utils_module, "_post_activity_dt", wraps=utils_module._post_activity_dt) as mock_activity:
+            result = utils_module.dedupe_posts_by_link(posts)
+
+        # Three incoming posts plus one re-evaluation after the single merge
+        self.assertEqual(mock_activity.call_count, 4)
+        self.assertEqual([p["id"] for p in result], [1, 2])
+        self.assertEqual(result[0]["date"], "2024-01-05T00:00:00Z")
+
 
 class TestFirebaseAnalyticsSnippet(unittest.TestCase):
     VALID_CONFIG = '{"apiKey": "abc", "projectId": "demo", "measurementId": "G-TEST123"}'
@@ -422,6 +422,20 @@ class TestGeneratorExtra(unittest.TestCase):
         self.assertEqual(post.tags, restored.tags)
         self.assertEqual(post.slug, restored.slug)
 
+    def test_post_to_dict_stores_body_once(self):
+        """The body is persisted as content_html only, not again inside api_data."""
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                api_data = {"id": 7, "title": "T", "url": "https://dev.to/u/t-7", "body_html": "<p>Body</p>"}
+                d = gen.Post(api_data).to_dict()
+                restored = gen.Post.from_dict(d)
+        self.assertEqual(d["content_html"], "<p>Body</p>")
+        self.assertNotIn("body_html", d["api_data"])
+        self.assertEqual(d["api_data"]["id"], 7)
+        self.assertIn("body_html", api_data)
+        self.assertEqual(restored.content_html, "<p>Body</p>")
+
     def test_strip_html_removes_tags(self):
         with tempfile.TemporaryDirectory() as td:
             with _chdir(Path(td)):
@@ -571,6 +585,201 @@ class TestGeneratorExtra(unittest.TestCase):
                 )
         self.assertEqual(post.slug, "my-great-post-12345")
 
+    def test_post_slug_url_edge_cases(self):
+        """Slug extraction handles short, trailing-slash, query and double-slash URLs."""
+        cases = [
+            ("https://dev.to/testuser/my-post-1/", "my-post-1"),
+            ("https://dev.to/testuser/my-post-1?x=1", "my-post-1"),
+            ("https://dev.to/testuser/my-post-1#comments", "my-post-1"),
+            ("https://dev.to/testuser//my-post-1", "edge-title"),
+            ("https://dev.to/testuser/", "edge-title"),
+            ("https://dev.to/testuser", "api-slug"),
+            ("https://dev.to//my-post-1", "api-slug"),
+        ]
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                for url, expected in cases:
+                    with self.subTest(url=url):
+                        post = gen.Post({"title": "Edge Title", "url": url, "slug": "api-slug"})
+                        self.assertEqual(post.slug, expected)
+
+    def test_post_uses_slots(self):
+        """Post instances carry no __dict__, including ones built by from_dict."""
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                post = gen.Post({"title": "T", "url": "https://dev.to/u/t-1"})
+                restored = gen.Post.from_dict(post.to_dict())
+        self.assertFalse(hasattr(post, "__dict__"))
+        self.assertFalse(hasattr(restored, "__dict__"))
+        self.assertEqual(restored.slug, "t-1")
+
+    def test_dedupe_posts_reuses_unmerged_post_objects(self):
+        """Only posts merged with a duplicate are rebuilt from their dict."""
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                old = gen.Post(
+                    {"id": 1, "title": "Old", "url": "https://dev.to/testuser/a-1", "published_at": "2024-01-01"}
+                )
+                new = gen.Post(
+                    {"id": 1, "title": "New", "url": "https://dev.to/testuser/a-1", "edited_at": "2024-02-01"}
+                )
+                other = gen.Post(
+                    {"id": 2, "title": "Other", "url": "https://dev.to/testuser/b-2", "published_at": "2023-01-01"}
+                )
+
+                posts_data, posts = gen._dedupe_posts([old, other, new])
+
+        self.assertEqual([p["title"] for p in posts_data], ["New", "Other"])
+        self.assertEqual([p.title for p in posts], ["New", "Other"])
+        self.assertIs(posts[1], other)
+        self.assertIsNot(posts[0], new)
+
+    def test_write_post_html_skips_unchanged_page(self):
+        """A page whose render inputs are unchanged is not rewritten unless forced."""
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                post = gen.Post(
+                    {
+                        "title": "Hash Test",
+                        "url": "https://dev.to/testuser/hash-test-1",
+                        "body_html": "<p>Body</p>",
+                    }
+                )
+                kwargs = {
+                    "post": post,
+                    "canonical": post.link,
+                    "social_image": gen.DEFAULT_SOCIAL_IMAGE,
+                    "optimization_data": {},
+                    "cross_references": {},
+                }
+                self.assertTrue(gen._write_post_html(**kwargs))
+                page = Path("posts") / "hash-test-1.html"
+                self.assertTrue(page.read_text(encoding="utf-8").startswith(gen.GENHASH_PREFIX))
+
+                self.assertFalse(gen._write_post_html(**kwargs))
+                self.assertTrue(gen._write_post_html(force=True, **kwargs))
+
+                post.content_html = "<p>Edited</p>"
+                self.assertTrue(gen._write_post_html(**kwargs))
+                self.assertIn("Edited", page.read_text(encoding="utf-8"))
+
+                config = json.dumps({"measurementId": "G-TEST123"})
+                with patch.dict(os.environ, {"FIREBASE_WEB_CONFIG": config}):
+                    self.assertTrue(gen._write_post_html(**kwargs))
+                    self.assertIn("G-TEST123", page.read_text(encoding="utf-8"))
+                    self.assertFalse(gen._write_post_html(**kwargs))
+
+                page.write_bytes(b"\xff\xfe not utf-8\n")
+                self.assertTrue(gen._write_post_html(**kwargs))
+
+    def test_sanitizer_change_invalidates_cached_pages(self):
+        """Changing the sanitizer allow-list re-renders pages whose own inputs are unchanged."""
+        from devto_mirror.core import html_sanitization
+
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                post = gen.Post({"title": "T", "url": "https://dev.to/testuser/san-1", "body_html": "<p>x</p>"})
+                kwargs = {
+                    "post": post,
+                    "canonical": post.link,
+                    "social_image": gen.DEFAULT_SOCIAL_IMAGE,
+                    "optimization_data": {},
+                    "cross_references": {},
+                }
+                self.assertTrue(gen._write_post_html(**kwargs))
+                self.assertFalse(gen._write_post_html(**kwargs))
+
+                allowed = html_sanitization._ALLOWED_TAGS + ["table"]
+                with patch.object(html_sanitization, "_ALLOWED_TAGS", allowed):
+                    self.assertTrue(gen._write_post_html(**kwargs))
+
+    def test_descriptions_are_escaped_exactly_once(self):
+        """Autoescape alone escapes descriptions and comment context (no &amp;amp;)."""
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                post = gen.Post(
+                    {"title": "T", "url": "https://dev.to/u/esc-1", "description": "Tom & Jerry", "body_html": ""}
+                )
+                gen._write_post_html(
+                    post=post,
+                    canonical=post.link,
+                    social_image=gen.DEFAULT_SOCIAL_IMAGE,
+                    optimization_data={},
+                    cross_references={},
+                )
+                gen._write_comment_notes(
+                    comment_items=[
+                        {"url": "https://dev.to/u/comment/1", "context": "Q & A", "local": "comments/1.html"}
+                    ],
+                    site_author="me",
+                )
+                page = (Path("posts") / "esc-1.html").read_text(encoding="utf-8")
+                note = (Path("comments") / "1.html").read_text(encoding="utf-8")
+        self.assertIn('content="Tom &amp; Jerry"', page)
+        self.assertIn("<p>Q &amp; A</p>", note)
+        self.assertNotIn("&amp;amp;", page + note)
+
+    def test_write_comment_notes_leaves_unchanged_notes_alone(self):
+        """An identical comment note is not rewritten on the next run."""
+        items = [{"url": "https://dev.to/u/comment/abc", "context": "Ctx", "local": "comments/abc.html"}]
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                gen._write_comment_notes(comment_items=items, site_author="me")
+                note = Path("comments") / "abc.html"
+                self.assertIn("Ctx", note.read_text(encoding="utf-8"))
+                os.utime(note, (1, 1))
+
+                gen._write_comment_notes(comment_items=items, site_author="me")
+                self.assertEqual(note.stat().st_mtime, 1)
+
+                gen._write_comment_notes(comment_items=items, site_author="someone else")
+                self.assertNotEqual(note.stat().st_mtime, 1)
+
+    def test_write_post_pages_parallel_matches_serial(self):
+        """Pages rendered in worker processes are identical to serially rendered ones."""
+        with tempfile.TemporaryDirectory() as td:
+            with _chdir(Path(td)):
+                gen = self._import_generator()
+                posts = [
+                    gen.Post(
+                        {
+                            "title": f"Post {i}",
+                            "url": f"https://dev.to/testuser/post-{i}",
+                            "body_html": f"<p>Body {i}</p><img src='x.png'>",
+                        }
+                    )
+                    for i in range(3)
+                ]
+
+                def jobs():
+                    return [
+                        gen._post_page_job(
+                            post=p,
+                            canonical=p.link,
+                            social_image=gen.DEFAULT_SOCIAL_IMAGE,
+                            optimization_data={},
+                            cross_references={},
+                            force=True,
+                        )
+                        for p in posts
+                    ]
+
+                gen._write_post_pages(jobs(), max_workers=1)
+                serial = [(Path("posts") / f"post-{i}.html").read_text(encoding="utf-8") for i in range(3)]
+                with patch("devto_mirror.core.process_pool.MIN_PARALLEL_BATCH", 1):
+                    with self.assertNoLogs("devto_mirror.core.process_pool", level="WARNING"):
+                        gen._write_post_pages(jobs(), max_workers=2)
+                parallel = [(Path("posts") / f"post-{i}.html").read_text(encoding="utf-8") for i in range(3)]
+        self.assertEqual(parallel, serial)
+        self.assertIn('width="800"', serial[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,9 +6,11 @@ import unittest
 from unittest.mock import Mock
 
 from devto_mirror.ai_optimization.cross_reference import (
+    _tag_bloom,
     add_source_attribution,
     create_dev_to_backlinks,
     enhance_post_with_cross_references,
+    enhance_posts_with_cross_references,
     generate_related_links,
 )
 
@@ -147,6 +149,19 @@ class TestCrossReference(unittest.TestCase):
         self.assertTrue(enhanced["has_related_posts"])
         self.assertTrue(enhanced["has_backlinks"])
 
+    def test_enhance_posts_with_cross_references_matches_single_post(self):
+        """Test that the batch form returns the per-post results in order."""
+        batch = enhance_posts_with_cross_references(self.all_posts, self.all_posts)
+
+        self.assertEqual(len(batch), len(self.all_posts))
+        for post, enhanced in zip(self.all_posts, batch):
+            single = enhance_post_with_cross_references(post, self.all_posts)
+            self.assertEqual(
+                [link["title"] for link in enhanced["related_posts"]],
+                [link["title"] for link in single["related_posts"]],
+            )
+            self.assertEqual(enhanced["attribution"], single["attribution"])
+
     def test_related_links_scoring(self):
         """Test that related links are properly scored by tag overlap."""
         related_links = generate_related_links(self.mock_post, self.all_posts, max_related=10)
@@ -156,6 +171,40 @@ class TestCrossReference(unittest.TestCase):
             for i in range(len(related_links) - 1):
                 self.assertGreaterEqual(related_links[i]["relevance_score"], related_links[i + 1]["relevance_score"])
 
+    def test_related_links_match_tags_case_insensitively(self):
+        """Test that the tag prefilter does not drop case-only matches."""
+        other = Mock()
+        other.title = "Upper Case Tags"
+        other.link = "https://dev.to/testuser/upper-111"
+        other.slug = "upper-111"
+        other.tags = ["PYTHON"]
+        other.description = ""
+        other.date = "2024-01-05"
+
+        related_links = generate_related_links(self.mock_post, [self.mock_post, other])
+
+        self.assertEqual([link["title"] for link in related_links], ["Upper Case Tags"])
+        self.assertEqual(related_links[0]["shared_tags"], ["python"])
+
+    def test_related_links_list_shared_tags_in_sorted_order(self):
+        """Test that shared tags do not depend on set iteration order (they feed the page genhash)."""
+        other = Mock()
+        other.title = "Many Shared Tags"
+        other.link = "https://dev.to/testuser/many-222"
+        other.slug = "many-222"
+        other.tags = ["tutorial", "python", "testing"]
+        other.description = ""
+        other.date = "2024-01-06"
+
+        related_links = generate_related_links(self.mock_post, [self.mock_post, other])
+
+        self.assertEqual(related_links[0]["shared_tags"], ["python", "testing", "tutorial"])
+
+    def test_tag_bloom_shares_bits_for_shared_tags(self):
+        """Test that overlapping tag sets always produce overlapping Bloom masks."""
+        self.assertNotEqual(_tag_bloom(["python", "testing"]) & _tag_bloom(["python"]), 0)
+        self.assertEqual(_tag_bloom([]), 0)
+
     def test_attribution_meta_tags(self):
         """Test that attribution generates proper meta tags."""
         attribution = add_source_attribution(self.mock_post)
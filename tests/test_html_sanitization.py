@@ -2,8 +2,9 @@
 """Unit tests for HTML sanitization helpers."""
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
-from devto_mirror.core.html_sanitization import sanitize_html_content
+from devto_mirror.core.html_sanitization import sanitize_html_content, strip_html_tags
 
 
 class TestHtmlSanitization(unittest.TestCase):
@@ -41,6 +42,19 @@ class TestHtmlSanitization(unittest.TestCase):
         self.assertIn("hi", out)
         self.assertIn("bye", out)
 
+    def test_strip_html_tags_keeps_text(self):
+        self.assertEqual(strip_html_tags("<p>Hello <b>world</b></p>"), "Hello world")
+        self.assertEqual(strip_html_tags(""), "")
+
+    def test_concurrent_threads_get_consistent_results(self):
+        html_in = '<div class="x"><p>Para <em>one</em></p><img src="a.png" onerror="x()"></div>' * 20
+        expected = sanitize_html_content(html_in)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(sanitize_html_content, [html_in] * 64))
+
+        self.assertEqual(results, [expected] * 64)
+
 
 if __name__ == "__main__":
     unittest.main()
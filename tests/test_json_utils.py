@@ -0,0 +1,78 @@
+"""Tests for JSON file helpers."""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from devto_mirror.core import json_utils
+from devto_mirror.core.json_utils import dump_json_file, load_json_file
+
+# orjson is an optional speedup and not a declared dependency; its paths are only
+# exercised where it happens to be installed.
+requires_orjson = unittest.skipUnless(json_utils.orjson is not None, "orjson not installed")
+
+
+class TestLoadJsonFile(unittest.TestCase):
+    """Tests for load_json_file with and without orjson."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "posts_data.json"
+
+    def test_loads_unicode_content(self):
+        self.path.write_text(json.dumps([{"title": "Café ☕"}], ensure_ascii=False), encoding="utf-8")
+        self.assertEqual(load_json_file(self.path), [{"title": "Café ☕"}])
+
+    def test_stdlib_fallback_when_orjson_missing(self):
+        self.path.write_text('{"a": [1, 2]}', encoding="utf-8")
+        with patch.object(json_utils, "orjson", None):
+            self.assertEqual(load_json_file(self.path), {"a": [1, 2]})
+
+    def test_invalid_json_raises_json_decode_error(self):
+        self.path.write_text("{not json", encoding="utf-8")
+        with patch.object(json_utils, "orjson", None):
+            with self.assertRaises(json.JSONDecodeError):
+                load_json_file(self.path)
+
+    def test_empty_file_raises_json_decode_error(self):
+        self.path.write_bytes(b"")
+        with patch.object(json_utils, "orjson", None):
+            with self.assertRaises(json.JSONDecodeError):
+                load_json_file(self.path)
+
+    @requires_orjson
+    def test_orjson_errors_are_json_decode_errors(self):
+        """The mmap-backed orjson path reports bad and empty files like the stdlib."""
+        for content in (b"{not json", b""):
+            with self.subTest(content=content):
+                self.path.write_bytes(content)
+                with self.assertRaises(json.JSONDecodeError):
+                    load_json_file(self.path)
+
+
+class TestDumpJsonFile(unittest.TestCase):
+    """Tests for dump_json_file with and without orjson."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.path = Path(self._tmp.name) / "posts_data.json"
+
+    def test_stdlib_indented_output(self):
+        data = [{"title": "Café ☕", "tags": [], "api_data": {"id": 1, "nested": {"x": [1.5, None, True]}}}]
+        with patch.object(json_utils, "orjson", None):
+            dump_json_file(self.path, data)
+        self.assertEqual(self.path.read_text(encoding="utf-8"), json.dumps(data, indent=2, ensure_ascii=False))
+
+    @requires_orjson
+    def test_orjson_matches_stdlib_indented_output(self):
+        data = [{"title": "Café ☕", "tags": [], "api_data": {"id": 1, "nested": {"x": [1.5, None, True]}}}]
+        dump_json_file(self.path, data)
+        self.assertEqual(self.path.read_text(encoding="utf-8"), json.dumps(data, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
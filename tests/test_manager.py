@@ -2,10 +2,23 @@
 Tests for the AIOptimizationManager module.
 """
 
+import threading
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from devto_mirror.ai_optimization import AIOptimizationManager, create_default_ai_optimization_manager
+from devto_mirror.ai_optimization.manager import HAS_SCHEMA, HAS_SITEMAP
+
+
+class _FailingSchemaGenerator:
+    """Picklable schema generator whose article schema raises, to simulate a bug in a worker."""
+
+    def generate_article_schema(self, post, canonical_url, api_data):
+        raise TypeError("schema bug")
+
+    def generate_breadcrumb_schema(self, post):
+        return {}
 
 
 class TestAIOptimizationManager(unittest.TestCase):
@@ -47,6 +60,17 @@ class TestAIOptimizationManager(unittest.TestCase):
         self.assertFalse(empty_manager.component_status["cross_reference"])
         self.assertFalse(empty_manager.component_status["sitemap"])
 
+    def test_component_mask_matches_status(self):
+        """Test that the component bitmask drives the reported status."""
+        partial_manager = AIOptimizationManager(schema_generator=Mock(), sitemap_generator=Mock())
+
+        self.assertEqual(partial_manager.component_mask, HAS_SCHEMA | HAS_SITEMAP)
+        status = partial_manager.get_optimization_status()
+        self.assertEqual(status["active_components"], 2)
+        self.assertTrue(status["components"]["schema"])
+        self.assertFalse(status["components"]["metadata"])
+        self.assertTrue(status["components"]["sitemap"])
+
     def test_optimize_post_with_all_components(self):
         """Test post optimization with all components working."""
         # Set up mock returns
@@ -83,6 +107,17 @@ class TestAIOptimizationManager(unittest.TestCase):
         self.assertEqual(result["json_ld_schemas"], [])
         self.assertEqual(result["enhanced_metadata"], {})
 
+    def test_optimize_post_without_schema_generator(self):
+        """Test that optimize_post returns defaults early when no schema generator is configured."""
+        metadata_enhancer = Mock()
+        manager = AIOptimizationManager(metadata_enhancer=metadata_enhancer)
+
+        result = manager.optimize_post(Mock())
+
+        self.assertFalse(result["optimization_applied"])
+        self.assertEqual(result["enhanced_metadata"], {})
+        metadata_enhancer.enhance_post_metadata.assert_not_called()
+
     def test_optimize_post_with_component_failure(self):
         """Test post optimization when a component fails."""
         # Make schema generator raise an exception
@@ -102,6 +137,88 @@ class TestAIOptimizationManager(unittest.TestCase):
             self.manager.optimize_post(mock_post)
         self.assertIn("Schema error", str(cm.exception))
 
+    def test_optimize_post_regenerates_schemas_each_call(self):
+        """Test a reused manager reflects changed interaction stats instead of serving stale schemas."""
+        self.mock_schema_generator.generate_article_schema.side_effect = lambda post, url, api_data: {
+            "@type": "Article",
+            "commentCount": api_data["comments_count"],
+        }
+        self.mock_schema_generator.generate_breadcrumb_schema.return_value = {"@type": "BreadcrumbList"}
+        post = Mock(link="https://dev.to/test/post", slug="test-post")
+        post.api_data = {"edited_at": "2024-01-01T00:00:00Z", "comments_count": 1}
+
+        first = self.manager.optimize_post(post)
+        post.api_data = {"edited_at": "2024-01-01T00:00:00Z", "comments_count": 5}
+        second = self.manager.optimize_post(post)
+
+        self.assertEqual(first["json_ld_schemas"][0]["commentCount"], 1)
+        self.assertEqual(second["json_ld_schemas"][0]["commentCount"], 5)
+
+    def test_optimize_posts_serial(self):
+        """Test batch optimization with a single worker runs in-process."""
+        self.mock_schema_generator.generate_article_schema.return_value = {"@type": "Article"}
+        self.mock_schema_generator.generate_breadcrumb_schema.return_value = {"@type": "BreadcrumbList"}
+        posts = [Mock(link="https://dev.to/test/a", slug="a", api_data={}), Mock(link="", slug="b", api_data={})]
+
+        results = self.manager.optimize_posts(posts, all_posts=posts, max_workers=1)
+
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(r["optimization_applied"] for r in results))
+        self.assertEqual(self.mock_schema_generator.generate_article_schema.call_count, 2)
+
+    @patch("devto_mirror.core.process_pool.MIN_PARALLEL_BATCH", 1)
+    def test_optimize_posts_falls_back_when_not_picklable(self):
+        """Test batch optimization falls back to serial when a post cannot be pickled."""
+        self.mock_schema_generator.generate_article_schema.return_value = {"@type": "Article"}
+        self.mock_schema_generator.generate_breadcrumb_schema.return_value = {"@type": "BreadcrumbList"}
+        posts = [
+            SimpleNamespace(link=f"https://dev.to/test/p-{i}", slug=f"p-{i}", api_data={}, lock=threading.Lock())
+            for i in range(3)
+        ]
+
+        with self.assertLogs("devto_mirror.core.process_pool", level="WARNING") as logs:
+            results = self.manager.optimize_posts(posts, max_workers=2)
+
+        self.assertIn("cannot pickle", logs.output[0])
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(r["optimization_applied"] for r in results))
+        self.assertEqual(self.mock_schema_generator.generate_article_schema.call_count, 3)
+
+    @patch("devto_mirror.core.process_pool.MIN_PARALLEL_BATCH", 1)
+    def test_optimize_posts_parallel_matches_serial(self):
+        """Test process-parallel batch optimization preserves order and output."""
+        manager = create_default_ai_optimization_manager("Test Site", "https://test.com")
+        posts = [
+            SimpleNamespace(
+                title=f"Post {i}",
+                link=f"https://dev.to/test/post-{i}",
+                slug=f"post-{i}",
+                date="2024-01-01T00:00:00Z",
+                description="",
+                content_html="<p>Hello world</p>",
+                cover_image="",
+                tags=["python"],
+                author="Test",
+                api_data={},
+            )
+            for i in range(4)
+        ]
+
+        results = manager.optimize_posts(posts, all_posts=posts, max_workers=2)
+
+        self.assertEqual([r["json_ld_schemas"][0]["url"] for r in results], [p.link for p in posts])
+        self.assertTrue(all(r["optimization_applied"] for r in results))
+
+    @patch("devto_mirror.core.process_pool.MIN_PARALLEL_BATCH", 1)
+    def test_optimize_posts_propagates_worker_errors(self):
+        """Test a genuine error inside a worker is raised, not treated as a missing pool."""
+        manager = AIOptimizationManager(schema_generator=_FailingSchemaGenerator())
+        posts = [SimpleNamespace(link=f"https://dev.to/test/p-{i}", slug=f"p-{i}", api_data={}) for i in range(3)]
+
+        with self.assertNoLogs("devto_mirror.core.process_pool", level="WARNING"):
+            with self.assertRaisesRegex(TypeError, "schema bug"):
+                manager.optimize_posts(posts, max_workers=2)
+
     def test_generate_optimized_sitemap_success(self):
         """Test successful sitemap generation."""
         self.mock_sitemap_generator.generate_main_sitemap.return_value = "<xml>sitemap</xml>"
@@ -131,7 +248,7 @@ class TestAIOptimizationManager(unittest.TestCase):
             self.manager.generate_optimized_sitemap([], [])
         self.assertIn("Sitemap error", str(cm.exception))
 
-    @patch("devto_mirror.ai_optimization.AIOptimizedPost")
+    @patch("devto_mirror.ai_optimization.manager.AIOptimizedPost")
     def test_create_optimized_post(self, mock_optimized_post_class):
         """Test creating an optimized post wrapper."""
         mock_post = Mock()
@@ -143,7 +260,7 @@ class TestAIOptimizationManager(unittest.TestCase):
         self.assertEqual(result, mock_optimized_post)
         mock_optimized_post_class.from_post.assert_called_once_with(mock_post, self.mock_content_analyzer)
 
-    @patch("devto_mirror.ai_optimization.AIOptimizedPost")
+    @patch("devto_mirror.ai_optimization.manager.AIOptimizedPost")
     def test_create_optimized_posts(self, mock_optimized_post_class):
         """Test creating multiple optimized post wrappers."""
         mock_posts = [Mock(), Mock()]
@@ -155,6 +272,17 @@ class TestAIOptimizationManager(unittest.TestCase):
         self.assertEqual(len(result), 2)
         self.assertEqual(result, mock_optimized_posts)
 
+    @patch("devto_mirror.ai_optimization.manager.AIOptimizedPost")
+    def test_create_optimized_posts_falls_back_without_analyzer(self, mock_optimized_post_class):
+        """Test that a failing wrapper falls back to one without the shared analyzer."""
+        mock_post = Mock()
+        mock_optimized_post_class.from_post.side_effect = Exception("Analyzer error")
+
+        result = self.manager.create_optimized_posts([mock_post])
+
+        self.assertEqual(result, [mock_optimized_post_class.return_value])
+        mock_optimized_post_class.assert_called_once_with(mock_post, None)
+
     def test_get_optimization_status(self):
         """Test getting optimization status."""
         status = self.manager.get_optimization_status()
@@ -167,10 +295,10 @@ class TestAIOptimizationManager(unittest.TestCase):
 class TestCreateDefaultAIOptimizationManager(unittest.TestCase):
     """Test cases for create_default_ai_optimization_manager function."""
 
-    @patch("devto_mirror.ai_optimization.DevToAISitemapGenerator")
-    @patch("devto_mirror.ai_optimization.DevToContentAnalyzer")
-    @patch("devto_mirror.ai_optimization.DevToMetadataEnhancer")
-    @patch("devto_mirror.ai_optimization.DevToSchemaGenerator")
+    @patch("devto_mirror.ai_optimization.manager.DevToAISitemapGenerator")
+    @patch("devto_mirror.ai_optimization.manager.DevToContentAnalyzer")
+    @patch("devto_mirror.ai_optimization.manager.DevToMetadataEnhancer")
+    @patch("devto_mirror.ai_optimization.manager.DevToSchemaGenerator")
     def test_create_default_manager(self, mock_schema, mock_metadata, mock_content, mock_sitemap):
         """Test creating a default manager with all components."""
         mock_schema_instance = Mock()
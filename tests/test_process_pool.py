@@ -0,0 +1,65 @@
+"""Tests for the process-pool batch helper."""
+
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+from devto_mirror.core import process_pool
+from devto_mirror.core.process_pool import map_in_processes
+
+
+def _square_with_pid(n):
+    return n * n, os.getpid()
+
+
+def _fail_on_three(n):
+    if n == 3:
+        raise TypeError("bad input")
+    return n
+
+
+class TestMapInProcesses(unittest.TestCase):
+    """Tests for map_in_processes."""
+
+    def setUp(self):
+        patcher = patch.object(process_pool, "MIN_PARALLEL_BATCH", 1)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_runs_in_worker_processes_in_order(self):
+        results = map_in_processes(_square_with_pid, [(i,) for i in range(6)], max_workers=2)
+
+        self.assertEqual([value for value, _pid in results], [i * i for i in range(6)])
+        self.assertNotIn(os.getpid(), {pid for _value, pid in results})
+
+    def test_small_batch_runs_serially(self):
+        with patch.object(process_pool, "MIN_PARALLEL_BATCH", 10):
+            self.assertIsNone(map_in_processes(_square_with_pid, [(i,) for i in range(6)], max_workers=2))
+
+    def test_env_switch_disables_pool(self):
+        with patch.dict(os.environ, {"DEVTO_MIRROR_PARALLEL": "false"}):
+            self.assertIsNone(map_in_processes(_square_with_pid, [(i,) for i in range(6)], max_workers=2))
+
+    def test_single_worker_runs_serially(self):
+        self.assertIsNone(map_in_processes(_square_with_pid, [(i,) for i in range(6)], max_workers=1))
+
+    def test_unpicklable_task_runs_serially(self):
+        for args in ((threading.Lock(),), (lambda: None,)):
+            with self.subTest(arg=type(args[0]).__name__):
+                with self.assertLogs("devto_mirror.core.process_pool", level="WARNING"):
+                    self.assertIsNone(map_in_processes(_square_with_pid, [args, args], max_workers=2))
+
+    def test_worker_errors_propagate(self):
+        with self.assertNoLogs("devto_mirror.core.process_pool", level="WARNING"):
+            with self.assertRaisesRegex(TypeError, "bad input"):
+                map_in_processes(_fail_on_three, [(i,) for i in range(6)], max_workers=2)
+
+    def test_pool_start_failure_runs_serially(self):
+        with patch.object(process_pool, "ProcessPoolExecutor", side_effect=OSError("no semaphores")):
+            with self.assertLogs("devto_mirror.core.process_pool", level="WARNING"):
+                self.assertIsNone(map_in_processes(_square_with_pid, [(i,) for i in range(6)], max_workers=2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -189,6 +189,19 @@ class TestDevToSchemaGenerator(unittest.TestCase):
         self.assertEqual(items[2]["name"], "My Test Post")
         self.assertEqual(items[2]["item"], "https://example.com/posts/my-test-post.html")
 
+    def test_generate_breadcrumb_schema_relative_urls(self):
+        """Test breadcrumb schema without a site URL uses relative paths and fresh items."""
+        generator = DevToSchemaGenerator()
+        mock_post = Mock()
+        mock_post.configure_mock(**{"title": "My Test Post", "slug": "my-test-post"})
+
+        first = generator.generate_breadcrumb_schema(mock_post)["itemListElement"]
+        second = generator.generate_breadcrumb_schema(mock_post)["itemListElement"]
+
+        self.assertEqual([item["item"] for item in first], ["/", "/posts", "/posts/my-test-post.html"])
+        first[0]["name"] = "Changed"
+        self.assertEqual(second[0]["name"], "Home")
+
     def test_schema_validation_integration(self):
         """Test that generated schemas pass validation."""
         mock_post = Mock()
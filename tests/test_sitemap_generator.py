@@ -276,6 +276,14 @@ class TestDevToAISitemapGenerator(unittest.TestCase):
         changefreq = self.generator._determine_post_changefreq(no_date_post)
         self.assertEqual(changefreq, "monthly")
 
+    def test_determine_post_changefreq_uses_reference_time(self):
+        """Post age is measured against the shared reference time when one is given."""
+        post = Mock()
+        post.configure_mock(**{"date": "2024-01-01T00:00:00Z", "api_data": {}})
+
+        self.assertEqual(self.generator._determine_post_changefreq(post, datetime(2024, 1, 3)), "daily")
+        self.assertEqual(self.generator._determine_post_changefreq(post, datetime(2024, 1, 20)), "weekly")
+
     def test_create_url_entry(self):
         """Test URL entry creation."""
         entry = self.generator._create_url_entry(
@@ -3,6 +3,7 @@ Tests for the AI optimization utils module.
 """
 
 import unittest
+from datetime import datetime
 
 from devto_mirror.ai_optimization.utils import determine_content_type, validate_json_ld_schema
 
@@ -118,6 +119,23 @@ class TestValidateJsonLdSchema(unittest.TestCase):
 
         self.assertTrue(validate_json_ld_schema(schema))
 
+    def test_unserializable_value(self):
+        """Test validation fails when the schema cannot be serialized to JSON."""
+        schema = {
+            "@context": "https://schema.org",
+            "@type": "Article",
+            "keywords": {"not", "json"},
+        }
+
+        self.assertFalse(validate_json_ld_schema(schema))
+
+    def test_serializability_matches_tojson(self):
+        """Test validation accepts and rejects exactly what the stdlib tojson filter can render."""
+        base = {"@context": "https://schema.org", "@type": "Article"}
+
+        self.assertFalse(validate_json_ld_schema({**base, "datePublished": datetime(2024, 1, 1)}))
+        self.assertTrue(validate_json_ld_schema({**base, "mentions": {1: "first"}}))
+
 
 class TestDetermineContentType(unittest.TestCase):
     """Test cases for determine_content_type function."""